@@ -18,7 +18,13 @@ This module extends the Fusion 360 MCP Server with CAM-specific operations:
 """
 
 import json
+import math
+import itertools
+import logging
 import os
+import traceback
+import types
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 
 # Fusion 360 imports - these are available when running inside Fusion
@@ -30,6 +36,34 @@ try:
 except ImportError:
     FUSION_AVAILABLE = False
 
+# API capability flags, probed once per Fusion version instead of per object
+if FUSION_AVAILABLE:
+    _operation_cls = getattr(adsk.cam, 'Operation', None)
+    _tool_cls = getattr(adsk.cam, 'Tool', None)
+    _OPERATION_HAS_ERROR = hasattr(_operation_cls, 'hasError')
+    _OPERATION_HAS_SUPPRESSED = hasattr(_operation_cls, 'isSuppressed')
+    _TOOL_HAS_FLUTES = hasattr(_tool_cls, 'numberOfFlutes')
+    _TOOL_HAS_DESCRIPTION = hasattr(_tool_cls, 'description')
+else:
+    _OPERATION_HAS_ERROR = False
+    _OPERATION_HAS_SUPPRESSED = False
+    _TOOL_HAS_FLUTES = False
+    _TOOL_HAS_DESCRIPTION = False
+
+# Attempt to read DEBUG flag from parent config (controls traceback details)
+try:
+    from . import config
+    DEBUG = config.DEBUG
+except:
+    DEBUG = False
+
+# Optional fast JSON serializer; falls back to stdlib json when not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Feature detection and geometry analysis modules
 # Provides RecognizedHole/RecognizedPocket wrappers plus orientation analysis
 try:
@@ -83,8 +117,8 @@ try:
         get_feedback_statistics,
         export_feedback_history,
         clear_feedback_history,
-        get_matching_feedback,
-        adjust_confidence_from_feedback,
+        get_weighted_acceptance_rate_sql,
+        adjust_confidence_from_rate,
         should_notify_learning,
         get_conflicting_choices
     )
@@ -92,6 +126,8 @@ try:
 except ImportError:
     FEEDBACK_LEARNING_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -126,17 +162,41 @@ def _to_mm(cm_value: float) -> Optional[dict]:
     }
 
 
-def _extract_stock_info(setup):
+def _param_value(params, name: str):
+    """
+    Get (expression, mm value) for a named parameter.
+
+    Args:
+        params: CAMParameters collection (e.g. setup.parameters)
+        name: Parameter name
+
+    Returns:
+        Tuple of (expression, {"value": X, "unit": "mm"} or None),
+        or None if the parameter doesn't exist
+    """
+    param = params.itemByName(name)
+    if not param:
+        return None
+    value = param.value
+    return param.expression, _to_mm(value.value) if value else None
+
+
+def _extract_stock_info(setup, params=None):
     """
     Extract stock information from a CAM setup via parameters.
 
     The CAM API doesn't expose stock via direct properties like StockModes.
     Instead, stock configuration is accessed through setup.parameters.
+
+    Args:
+        setup: CAM Setup
+        params: Optional setup.parameters collection already fetched by the caller
     """
     stock_info = {}
 
     try:
-        params = setup.parameters
+        if params is None:
+            params = setup.parameters
 
         # Helper to safely get parameter expression
         def get_param(name, default=None):
@@ -253,33 +313,99 @@ def _extract_stock_info(setup):
     return stock_info
 
 
+# Last CAM product found, keyed by its document. Only successful lookups are
+# cached so a CAM workspace created later is still picked up.
+_cam_product_cache = {"document": None, "cam": None}
+
+
 def _get_cam_product():
-    """Get CAM product from active document, if available."""
+    """
+    Get CAM product from active document, if available.
+
+    The product lookup scans doc.products; the result is memoized for the
+    active document and reused while the CAM object is still valid.
+    """
     app = _get_app()
     doc = app.activeDocument
 
     if not doc:
         return None
 
+    cached_cam = _cam_product_cache["cam"]
+    if cached_cam is not None and _cam_product_cache["document"] == doc:
+        try:
+            if cached_cam.isValid:
+                return cached_cam
+        except:
+            pass
+
     # Look for CAM product
     for product in doc.products:
         if product.productType == 'CAMProductType':
-            return adsk.cam.CAM.cast(product)
+            cam = adsk.cam.CAM.cast(product)
+            _cam_product_cache["document"] = doc
+            _cam_product_cache["cam"] = cam
+            return cam
 
     return None
 
 
+def _dumps(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def _format_response(data: Any, is_error: bool = False) -> Dict:
     """Format response in MCP-compliant format."""
     return {
         "content": [{
             "type": "text",
-            "text": json.dumps(data, indent=2) if isinstance(data, (dict, list)) else str(data)
+            "text": _dumps(data) if isinstance(data, (dict, list)) else str(data)
         }],
         "isError": is_error
     }
 
 
+def _iter_json_with_list(header: Dict[str, Any], list_key: str, item_texts: List[str]):
+    """
+    Yield the indented JSON text of header plus a trailing list of items.
+
+    Items are already-serialized _dumps() fragments, so large per-item dicts
+    can be released as soon as they are serialized instead of being kept for
+    one big dump. Output is identical to _dumps({**header, list_key: items}).
+    """
+    yield "{"
+    for key, value in header.items():
+        yield "\n  " + _dumps(key) + ": " + _dumps(value).replace("\n", "\n  ") + ","
+    yield "\n  " + _dumps(list_key) + ": ["
+    if item_texts:
+        separator = ""
+        for text in item_texts:
+            # JSON strings never contain raw newlines, so re-indenting is safe
+            yield separator + "\n    " + text.replace("\n", "\n    ")
+            separator = ","
+        yield "\n  ]"
+    else:
+        yield "]"
+    yield "\n}"
+
+
+def _exception_details() -> Optional[str]:
+    """
+    Get the current exception traceback, only when DEBUG is enabled.
+
+    format_exc() walks and formats the whole stack; routine failures
+    (no active design, missing CAM workspace) don't need it.
+    """
+    if not DEBUG:
+        return None
+    return traceback.format_exc()
+
+
 def _format_error(message: str, details: str = None) -> Dict:
     """Format error response."""
     error_data = {"error": message}
@@ -367,6 +493,150 @@ def _group_by_machining_priority(features: List[Dict[str, Any]]) -> List[Dict[st
     return [group for _, group in sorted(priority_groups.items()) if group["features"]]
 
 
+# Fallback bounding-box orientations used when feature-based analysis isn't run:
+# (axis, score bonus, base plane axes, height axis, reason)
+_BBOX_ORIENTATIONS = (
+    ("Z_UP", 0.2, ("x", "y"), "z", "XY plane as base"),
+    ("Y_UP", 0.1, ("x", "z"), "y", "XZ plane as base"),
+    ("X_UP", 0.0, ("y", "z"), "x", "YZ plane as base"),
+)
+
+
+# =============================================================================
+# FACE GEOMETRY HANDLERS
+# =============================================================================
+# Per-face classification for analyze_geometry_for_cam. Each handler receives
+# the face, its geometry, the feature list and a mutable state list:
+#   [min_radius_mm, planar_count, cylindrical_count, feature_count, max_features]
+# Handlers are dispatched by geometry objectType (one dict lookup per face)
+# instead of an isinstance() chain.
+#
+# Handlers record raw (unrounded) tuples; only the features that are actually
+# emitted in the response are rounded and turned into dicts by
+# _format_face_feature(). Once max_features have been recorded, handlers
+# only update counters and min radius (no further detail API calls).
+
+# Radians to degrees (cone half-angle conversion)
+_RAD_TO_DEG = 180.0 / math.pi
+
+_STATE_MIN_RADIUS = 0
+_STATE_PLANAR = 1
+_STATE_CYLINDRICAL = 2
+_STATE_FEATURE_COUNT = 3
+_STATE_MAX_FEATURES = 4
+
+# Default number of face features returned per body
+DEFAULT_MAX_FACE_FEATURES = 20
+
+# Default number of faces scanned per body (bounds latency on huge BReps)
+DEFAULT_MAX_FACES_SCANNED = 5000
+
+
+def _record_face_feature(features: List[tuple], state: list, raw: tuple) -> None:
+    """Count a face feature and keep it only while under the max_features cap."""
+    state[_STATE_FEATURE_COUNT] += 1
+    if len(features) < state[_STATE_MAX_FEATURES]:
+        features.append(raw)
+
+
+def _handle_cylinder_face(face, geom, features: List[tuple], state: list) -> None:
+    """Record a cylindrical face (hole or boss) and track minimum radius."""
+    radius_mm = geom.radius * 10
+    if radius_mm < state[_STATE_MIN_RADIUS]:
+        state[_STATE_MIN_RADIUS] = radius_mm
+    state[_STATE_CYLINDRICAL] += 1
+    _record_face_feature(features, state, ("cylindrical", radius_mm))
+
+
+def _handle_plane_face(face, geom, features: List[tuple], state: list) -> None:
+    """Record a significant planar face with its orientation normal."""
+    state[_STATE_PLANAR] += 1
+    area_mm2 = face.area * 100
+
+    # Only record significant planar faces
+    if area_mm2 > 10:
+        if len(features) >= state[_STATE_MAX_FEATURES]:
+            # Over the cap: count it but skip the normal evaluation
+            state[_STATE_FEATURE_COUNT] += 1
+            return
+
+        # Get face normal to determine orientation
+        evaluator = face.evaluator
+        _, normal = evaluator.getNormalAtPoint(face.pointOnFace)
+        _record_face_feature(features, state, ("planar", area_mm2, normal.x, normal.y, normal.z))
+
+
+def _handle_cone_face(face, geom, features: List[tuple], state: list) -> None:
+    """Record a conical face (countersink, chamfer, draft)."""
+    _record_face_feature(features, state, ("conical", geom.halfAngle))
+
+
+def _handle_sphere_face(face, geom, features: List[tuple], state: list) -> None:
+    """Record a spherical face."""
+    _record_face_feature(features, state, ("spherical", geom.radius * 10))
+
+
+def _handle_torus_face(face, geom, features: List[tuple], state: list) -> None:
+    """Record a toroidal face (fillet, round) and track minimum radius."""
+    minor_radius = geom.minorRadius * 10
+    if minor_radius < state[_STATE_MIN_RADIUS]:
+        state[_STATE_MIN_RADIUS] = minor_radius
+    _record_face_feature(features, state, ("toroidal", minor_radius, geom.majorRadius * 10))
+
+
+def _format_face_feature(raw: tuple) -> Dict[str, Any]:
+    """
+    Build the response dict for a raw face feature tuple.
+
+    Rounding is deferred to here so it only runs for emitted features.
+    """
+    ftype = raw[0]
+    if ftype == "cylindrical":
+        radius_mm = raw[1]
+        return {
+            "type": "cylindrical",
+            "radius_mm": round(radius_mm, 3),
+            "diameter_mm": round(radius_mm * 2, 3)
+        }
+    if ftype == "planar":
+        return {
+            "type": "planar",
+            "area_mm2": round(raw[1], 2),
+            "normal": {
+                "x": round(raw[2], 3),
+                "y": round(raw[3], 3),
+                "z": round(raw[4], 3)
+            }
+        }
+    if ftype == "conical":
+        return {
+            "type": "conical",
+            "half_angle": round(raw[1] * _RAD_TO_DEG, 2)
+        }
+    if ftype == "spherical":
+        return {
+            "type": "spherical",
+            "radius_mm": round(raw[1], 3)
+        }
+    return {
+        "type": "toroidal",
+        "minor_radius_mm": round(raw[1], 3),
+        "major_radius_mm": round(raw[2], 3)
+    }
+
+
+# Geometry objectType -> handler (e.g. "adsk::core::Cylinder")
+_FACE_GEOMETRY_HANDLERS = {}
+if FUSION_AVAILABLE:
+    _FACE_GEOMETRY_HANDLERS = {
+        adsk.core.Cylinder.classType(): _handle_cylinder_face,
+        adsk.core.Plane.classType(): _handle_plane_face,
+        adsk.core.Cone.classType(): _handle_cone_face,
+        adsk.core.Sphere.classType(): _handle_sphere_face,
+        adsk.core.Torus.classType(): _handle_torus_face,
+    }
+
+
 # =============================================================================
 # get_cam_state - Query current CAM workspace state
 # =============================================================================
@@ -415,27 +685,32 @@ def handle_get_cam_state(arguments: dict) -> dict:
                 "wcs_origin": None
             }
 
+            # Fetch the parameter collection once; stock and WCS lookups share it
+            try:
+                params = setup.parameters
+            except:
+                params = None
+
             # Get stock configuration via parameters (StockModes enum doesn't exist)
-            setup_info["stock"] = _extract_stock_info(setup)
+            setup_info["stock"] = _extract_stock_info(setup, params)
 
             # Get WCS (Work Coordinate System) info per CONTEXT.md decision
             try:
                 wcs_info = {}
-                params = setup.parameters
 
                 # Z position (stock top/bottom) - most critical for CAM planning
-                z_pos = params.itemByName("job_stockZPosition")
+                z_pos = _param_value(params, "job_stockZPosition")
                 if z_pos:
                     wcs_info["z_origin"] = {
-                        "expression": z_pos.expression,
-                        "value": _to_mm(z_pos.value.value) if z_pos.value else None
+                        "expression": z_pos[0],
+                        "value": z_pos[1]
                     }
 
                 # Try to get XY origin if available
                 try:
                     wcs_point = params.itemByName("job_wcsOriginPoint")
-                    if wcs_point and wcs_point.value:
-                        origin_point = wcs_point.value
+                    origin_point = wcs_point.value if wcs_point else None
+                    if origin_point:
                         if hasattr(origin_point, 'x'):
                             wcs_info["origin_point"] = {
                                 "x": _to_mm(origin_point.x),
@@ -464,8 +739,8 @@ def handle_get_cam_state(arguments: dict) -> dict:
                     "name": op.name,
                     "type": op.objectType.split("::")[-1] if "::" in op.objectType else op.objectType,
                     "is_valid": op.isValid,
-                    "has_error": op.hasError if hasattr(op, 'hasError') else False,
-                    "is_suppressed": op.isSuppressed if hasattr(op, 'isSuppressed') else False
+                    "has_error": op.hasError if _OPERATION_HAS_ERROR else False,
+                    "is_suppressed": op.isSuppressed if _OPERATION_HAS_SUPPRESSED else False
                 }
 
                 # Try to get strategy type
@@ -480,13 +755,14 @@ def handle_get_cam_state(arguments: dict) -> dict:
                 try:
                     tool = op.tool
                     if tool:
+                        tool_type = tool.type
                         op_info["tool"] = {
                             "description": tool.description,
-                            "type": tool.type.toString() if hasattr(tool.type, 'toString') else str(tool.type),
+                            "type": tool_type.toString() if hasattr(tool_type, 'toString') else str(tool_type),
                             "diameter": _to_mm(tool.diameter)
                         }
                         # Add flute count if available
-                        if hasattr(tool, 'numberOfFlutes'):
+                        if _TOOL_HAS_FLUTES:
                             op_info["tool"]["flutes"] = tool.numberOfFlutes
                 except:
                     pass
@@ -522,14 +798,209 @@ def handle_get_cam_state(arguments: dict) -> dict:
         return _format_response(result)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to get CAM state: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to get CAM state: {str(e)}", _exception_details())
 
 
 # =============================================================================
 # get_tool_library - Query Fusion's tool library
 # =============================================================================
 
+# Parsed document tool libraries, keyed by (document id, saved version, tool
+# count). Small LRU so switching between a few open documents stays cached.
+# A snapshot is rebuilt when the document is saved as a new version or tools
+# are added/removed.
+#
+# Limitation: the Fusion API exposes no revision for a tool library, so an
+# unsaved edit that keeps the tool count (e.g. changing a tool's diameter) is
+# served from the old snapshot until the document is saved or a tool is
+# added/removed. Snapshots hold only plain data and library indexes; tool
+# proxies are re-fetched from the library passed in on each call.
+_TOOL_LIBRARY_CACHE_SIZE = 4
+_tool_library_cache = OrderedDict()
+
+
+# Optional tool JSON geometry fields: (JSON key, response key, is length in mm)
+_TOOL_GEOMETRY_FIELDS = (
+    ("LF", "flute_length", True),
+    ("OAL", "overall_length", True),
+    ("SFDM", "shaft_diameter", True),
+    ("NOF", "flutes", False),
+)
+
+
+def _tool_library_cache_key(doc, doc_lib) -> tuple:
+    """Build the snapshot cache key for a document's tool library."""
+    try:
+        doc_id = doc.creationId
+    except:
+        doc_id = doc.name
+    try:
+        data_file = doc.dataFile
+        version = data_file.versionNumber if data_file else None
+    except:
+        version = None
+    return (doc_id, version, doc_lib.count)
+
+
+def _build_tool_snapshot(doc_lib) -> List[Dict[str, Any]]:
+    """
+    Parse every tool in a document tool library.
+
+    Only the tool JSON is read here. The response dict is built on demand by
+    _get_tool_info() for tools that pass the caller's filters.
+
+    Returns:
+        List of entries with the lowercased type, diameter in mm, the tool's
+        library index, its parsed JSON and a slot for the memoized tool_info
+    """
+    snapshot = []
+
+    for i in range(doc_lib.count):
+        try:
+            tool = doc_lib.item(i)
+        except Exception:
+            # Skip only this tool; the rest of the library is still returned
+            logger.warning("Skipping unreadable tool %d in document library", i, exc_info=True)
+            continue
+
+        # Parse tool JSON to get structured data. Any proxy or decode failure
+        # leaves the tool with empty data (filtered as type "" / diameter 0).
+        tool_data = {}
+        try:
+            tool_data = json.loads(tool.toJson())
+        except Exception:
+            logger.warning("Could not parse JSON of tool %d in document library", i, exc_info=True)
+        if not isinstance(tool_data, dict):
+            tool_data = {}
+
+        # Normalize once here so later reads need no exception handling
+        if not isinstance(tool_data.get("type"), str):
+            tool_data["type"] = ""
+        if not isinstance(tool_data.get("geometry"), dict):
+            tool_data["geometry"] = {}
+
+        # Only type and diameter are needed to filter
+        tool_type_str = tool_data["type"]
+        geometry = tool_data["geometry"]
+        diameter_mm = geometry.get("DC", 0)
+        if not isinstance(diameter_mm, (int, float)):
+            diameter_mm = 0
+
+        snapshot.append({
+            "type_lower": tool_type_str.lower(),
+            "diameter_mm": diameter_mm,
+            "index": i,
+            "data": tool_data,
+            "info": None
+        })
+
+    return snapshot
+
+
+def _get_tool_info(entry: Dict[str, Any], doc_lib) -> Optional[Dict[str, Any]]:
+    """
+    Build (once) the response dict for a snapshot entry, with explicit units.
+
+    The tool proxy is fetched from doc_lib (the library of the current call)
+    only when the description has to be read from it.
+
+    Returns:
+        tool_info dict, or None if the tool can no longer be read
+    """
+    tool_info = entry["info"]
+    if tool_info is not None:
+        return tool_info
+
+    tool_data = entry["data"]
+    geometry = tool_data.get("geometry", {})
+
+    try:
+        if _TOOL_HAS_DESCRIPTION:
+            description = doc_lib.item(entry["index"]).description
+        else:
+            description = tool_data.get("description", "")
+    except Exception:
+        logger.warning("Skipping tool %d: description unavailable", entry["index"], exc_info=True)
+        return None
+
+    tool_info = {
+        "description": description,
+        "type": tool_data.get("type", ""),
+        "diameter": {"value": round(entry["diameter_mm"], 3), "unit": "mm"},
+        "library": "Document Tools"
+    }
+
+    # Add geometry properties (lengths in mm)
+    for key, name, is_length in _TOOL_GEOMETRY_FIELDS:
+        value = geometry.get(key)
+        if value is None:
+            continue
+        if is_length:
+            if isinstance(value, (int, float)):
+                tool_info[name] = {"value": round(value, 3), "unit": "mm"}
+        else:
+            tool_info[name] = value
+
+    # Vendor info
+    vendor = tool_data.get("vendor", "")
+    if vendor:
+        tool_info["vendor"] = vendor
+
+    entry["info"] = tool_info
+    return tool_info
+
+
+def _tool_passes_filters(entry: Dict[str, Any], lowered_filters: List[str],
+                         diameter_range: Optional[List[float]]) -> bool:
+    """Check a snapshot entry against lowercased type filters and diameter range."""
+    if lowered_filters:
+        tool_type_lower = entry["type_lower"]
+        if not any(t in tool_type_lower for t in lowered_filters):
+            return False
+
+    if diameter_range:
+        diameter_mm = entry["diameter_mm"]
+        if diameter_mm < diameter_range[0] or diameter_mm > diameter_range[1]:
+            return False
+
+    return True
+
+
+def _matching_tool_info(entry: Dict[str, Any], doc_lib, lowered_filters: List[str],
+                        diameter_range: Optional[List[float]]) -> Optional[Dict[str, Any]]:
+    """
+    Get the tool_info for a snapshot entry if it passes the filters.
+
+    Never raises: a tool that fails is logged and skipped, so the lazy
+    islice/next pipeline in handle_get_tool_library keeps the tools it has.
+
+    Returns:
+        tool_info dict, or None if the tool is filtered out or unreadable
+    """
+    try:
+        if not _tool_passes_filters(entry, lowered_filters, diameter_range):
+            return None
+        return _get_tool_info(entry, doc_lib)
+    except Exception:
+        logger.warning("Skipping tool %d in document library", entry["index"], exc_info=True)
+        return None
+
+
+def _get_document_tool_snapshot(doc, doc_lib) -> List[Dict[str, Any]]:
+    """Get the parsed tool snapshot for a document library, building it on a miss."""
+    key = _tool_library_cache_key(doc, doc_lib)
+    snapshot = _tool_library_cache.get(key)
+    if snapshot is not None:
+        _tool_library_cache.move_to_end(key)
+        return snapshot
+
+    snapshot = _build_tool_snapshot(doc_lib)
+    _tool_library_cache[key] = snapshot
+    if len(_tool_library_cache) > _TOOL_LIBRARY_CACHE_SIZE:
+        _tool_library_cache.popitem(last=False)
+    return snapshot
+
+
 def handle_get_tool_library(arguments: dict) -> dict:
     """
     Query Fusion's tool library.
@@ -546,6 +1017,7 @@ def handle_get_tool_library(arguments: dict) -> dict:
         {
             "tools": [...],
             "total_count": int,
+            "more_available": bool,  # more tools matched than limit
             "libraries": [...]
         }
     """
@@ -572,6 +1044,7 @@ def handle_get_tool_library(arguments: dict) -> dict:
 
         available_libraries = []
         tools_data = []
+        more_available = False
 
         # PRIORITY 1: Document tool library (tools embedded in current document)
         # This is where user's working tools typically are
@@ -584,66 +1057,26 @@ def handle_get_tool_library(arguments: dict) -> dict:
                     "tool_count": doc_lib.count
                 })
 
-                # Collect tools from document library
-                for i in range(doc_lib.count):
-                    if len(tools_data) >= limit:
-                        break
-
-                    try:
-                        tool = doc_lib.item(i)
-
-                        # Parse tool JSON to get structured data
-                        tool_data = {}
-                        try:
-                            import json
-                            tool_json = tool.toJson()
-                            tool_data = json.loads(tool_json)
-                        except:
-                            pass
-
-                        # Extract properties from parsed JSON
-                        tool_type_str = tool_data.get("type", "")
-                        geometry = tool_data.get("geometry", {})
-                        diameter_mm = geometry.get("DC", 0) if geometry else 0
-
-                        # Apply filters
-                        if type_filter:
-                            type_match = any(t.lower() in tool_type_str.lower() for t in type_filter)
-                            if not type_match:
-                                continue
-
-                        if diameter_range:
-                            if diameter_mm < diameter_range[0] or diameter_mm > diameter_range[1]:
-                                continue
-
-                        # Build tool info with explicit units
-                        tool_info = {
-                            "description": tool.description if hasattr(tool, 'description') else tool_data.get("description", ""),
-                            "type": tool_type_str,
-                            "diameter": {"value": round(diameter_mm, 3), "unit": "mm"},
-                            "library": "Document Tools"
-                        }
-
-                        # Add geometry properties (all in mm)
-                        if geometry:
-                            if "LF" in geometry:
-                                tool_info["flute_length"] = {"value": round(geometry["LF"], 3), "unit": "mm"}
-                            if "OAL" in geometry:
-                                tool_info["overall_length"] = {"value": round(geometry["OAL"], 3), "unit": "mm"}
-                            if "SFDM" in geometry:
-                                tool_info["shaft_diameter"] = {"value": round(geometry["SFDM"], 3), "unit": "mm"}
-                            if "NOF" in geometry:
-                                tool_info["flutes"] = geometry["NOF"]
-
-                        # Vendor info
-                        vendor = tool_data.get("vendor", "")
-                        if vendor:
-                            tool_info["vendor"] = vendor
-
-                        tools_data.append(tool_info)
+                # Parsed tools are cached per document version; filters run
+                # over the cached snapshot without touching the Fusion API
+                snapshot = _get_document_tool_snapshot(_get_app().activeDocument, doc_lib)
+
+                # Filter on type/diameter first; description and geometry
+                # details are only assembled for tools that pass. Errors are
+                # contained per tool, so islice/next below cannot raise.
+                lowered_filters = [t.lower() for t in (type_filter or [])]
+                matching_infos = (
+                    tool_info for tool_info in (
+                        _matching_tool_info(entry, doc_lib, lowered_filters, diameter_range)
+                        for entry in snapshot
+                    )
+                    if tool_info is not None
+                )
 
-                    except:
-                        continue
+                # Stop at limit; one extra lookup tells the caller whether
+                # more tools matched
+                tools_data = list(itertools.islice(matching_infos, limit))
+                more_available = next(matching_infos, None) is not None
         except Exception as doc_err:
             pass  # Document library may not exist
 
@@ -655,6 +1088,7 @@ def handle_get_tool_library(arguments: dict) -> dict:
             "tools": tools_data,
             "returned_count": len(tools_data),
             "limit": limit,
+            "more_available": more_available,
             "filter_applied": filter_args if filter_args else None,
             "libraries": available_libraries
         }
@@ -662,14 +1096,253 @@ def handle_get_tool_library(arguments: dict) -> dict:
         return _format_response(result)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to query tool library: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to query tool library: {str(e)}", _exception_details())
 
 
 # =============================================================================
 # analyze_geometry_for_cam - Analyze part geometry
 # =============================================================================
 
+# Shared FeatureDetector so its per-body-revision recognition cache survives
+# between analyze_geometry_for_cam calls. Created on first use.
+_feature_detector = None
+
+
+def _get_feature_detector():
+    """Get the shared FeatureDetector, creating it on first use."""
+    global _feature_detector
+    if _feature_detector is None:
+        _feature_detector = FeatureDetector()
+    return _feature_detector
+
+
+def _analyze_body(body, analysis_type: str, max_features: int,
+                  max_faces: int = DEFAULT_MAX_FACES_SCANNED) -> Dict[str, Any]:
+    """
+    Analyze a single body for analyze_geometry_for_cam.
+
+    Runs synchronously on the calling thread: the Fusion API must only be
+    used from Fusion's main thread, so bodies are not analyzed in parallel.
+
+    Args:
+        body: BRepBody to analyze
+        analysis_type: "full", "quick", or "features_only"
+        max_features: Max face features to include
+        max_faces: Max faces scanned for face features and counters
+
+    Returns:
+        Body result dict (bounding box, features, orientations, ...)
+    """
+    bbox = body.boundingBox
+
+    # Read bounding box corners once (each access crosses the API boundary)
+    min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+    mnx, mny, mnz = min_pt.x, min_pt.y, min_pt.z
+    mxx, mxy, mxz = max_pt.x, max_pt.y, max_pt.z
+
+    # Basic measurements (convert cm to mm)
+    body_result = {
+        "name": body.name,
+        "bounding_box": {
+            "x": round((mxx - mnx) * 10, 2),
+            "y": round((mxy - mny) * 10, 2),
+            "z": round((mxz - mnz) * 10, 2),
+            "min_point": {
+                "x": round(mnx * 10, 2),
+                "y": round(mny * 10, 2),
+                "z": round(mnz * 10, 2)
+            },
+            "max_point": {
+                "x": round(mxx * 10, 2),
+                "y": round(mxy * 10, 2),
+                "z": round(mxz * 10, 2)
+            },
+            "unit": "mm"
+        },
+        "volume_mm3": round(body.volume * 1000, 2),  # cm³ to mm³
+        "surface_area_mm2": round(body.surfaceArea * 100, 2),  # cm² to mm²
+    }
+
+    # Material info if available
+    material = body.material
+    if material:
+        body_result["material"] = material.name
+    appearance = body.appearance
+    if appearance:
+        body_result["appearance"] = appearance.name
+
+    # Face count is a collection property; available in every mode
+    faces = body.faces
+    body_result["face_count"] = faces.count
+
+    # Feature analysis (if not quick mode)
+    if analysis_type in ['full', 'features_only']:
+        features = []
+        # min_radius, planar, cylindrical, feature_count, max_features
+        state = [float('inf'), 0, 0, 0, max_features]
+        get_handler = _FACE_GEOMETRY_HANDLERS.get
+
+        for face_idx, face in enumerate(faces):
+            if face_idx >= max_faces:
+                body_result["faces_scanned_truncated"] = True
+                break
+
+            geom = face.geometry
+
+            # Dispatch on geometry type (cylinder, plane, cone, sphere, torus)
+            handler = get_handler(geom.objectType)
+            if handler:
+                handler(face, geom, features, state)
+
+        min_radius = state[_STATE_MIN_RADIUS]
+        planar_count = state[_STATE_PLANAR]
+        cylindrical_count = state[_STATE_CYLINDRICAL]
+        feature_count = state[_STATE_FEATURE_COUNT]
+
+        body_result["feature_summary"] = {
+            "planar_faces": planar_count,
+            "cylindrical_faces": cylindrical_count,
+            "total_features_detected": feature_count
+        }
+
+        # Keep face-based features for backward compatibility
+        body_result["face_features"] = [_format_face_feature(f) for f in features]
+        if feature_count > max_features:
+            body_result["face_features_truncated"] = True
+            body_result["total_face_features"] = feature_count
+
+        body_result["min_internal_radius_mm"] = round(min_radius, 3) if min_radius != float('inf') else None
+
+        # Use FeatureDetector for production-ready feature recognition
+        # Provides holes and pockets/slots from Fusion's RecognizedHole/RecognizedPocket APIs
+        if FEATURE_DETECTOR_AVAILABLE and analysis_type == 'full':
+            try:
+                detector = _get_feature_detector()
+                if detector.is_available:
+                    # Detect holes using Fusion's RecognizedHole API
+                    detected_holes = detector.detect_holes(body)
+
+                    # Detect pockets/slots using Fusion's RecognizedPocket API
+                    # Note: slots are classified by aspect_ratio > 3.0
+                    detected_pockets = detector.detect_pockets(body)
+
+                    # Combine all recognized features for priority grouping
+                    all_recognized_features = detected_holes + detected_pockets
+
+                    # Split pockets/slots in one pass and count features by type
+                    pockets = []
+                    slots = []
+                    for f in detected_pockets:
+                        ftype = f.get("type")
+                        if ftype == "pocket":
+                            pockets.append(f)
+                        elif ftype == "slot":
+                            slots.append(f)
+                    hole_count = sum(1 for f in detected_holes if f.get("type") == "hole")
+                    pocket_count = len(pockets)
+                    slot_count = len(slots)
+
+                    # Group features by machining priority (drilling, roughing, finishing)
+                    features_by_priority = _group_by_machining_priority(all_recognized_features)
+
+                    # Add recognized features to result
+                    body_result["recognized_features"] = {
+                        "holes": detected_holes,
+                        "pockets": pockets,
+                        "slots": slots,
+                        "total_holes": hole_count,
+                        "total_pockets": pocket_count,
+                        "total_slots": slot_count
+                    }
+
+                    # Add priority-grouped features for CAM planning
+                    body_result["features_by_priority"] = features_by_priority
+
+                    # Add feature count summary
+                    body_result["feature_count"] = {
+                        "holes": hole_count,
+                        "pockets": pocket_count,
+                        "slots": slot_count,
+                        "total": len(all_recognized_features)
+                    }
+
+                    body_result["feature_detection_source"] = "fusion_api"
+
+                    # Enhanced orientation analysis with setup sequences
+                    # Uses OrientationAnalyzer when features are available
+                    if all_recognized_features:
+                        try:
+                            analyzer = OrientationAnalyzer(all_recognized_features)
+                            enhanced_orientations = analyzer.suggest_orientations(body)
+                            body_result["suggested_orientations"] = enhanced_orientations
+                            body_result["orientation_analysis_source"] = "feature_based"
+                        except Exception as orient_error:
+                            body_result["orientation_analysis_error"] = str(orient_error)
+                            body_result["orientation_analysis_source"] = "bounding_box"
+
+                    # Minimum tool radius calculation with 80% rule
+                    try:
+                        tool_radius_info = calculate_minimum_tool_radii(
+                            body, all_recognized_features
+                        )
+                        body_result["minimum_tool_radius"] = tool_radius_info
+                    except Exception as radius_error:
+                        body_result["minimum_tool_radius"] = {
+                            "error": str(radius_error),
+                            "global_minimum_radius": None,
+                            "recommended_tool_radius": None
+                        }
+                else:
+                    body_result["feature_detection_source"] = "face_analysis"
+                    body_result["recognized_features"] = None
+                    body_result["features_by_priority"] = None
+                    body_result["feature_count"] = None
+            except Exception as detector_error:
+                # Fallback to face analysis if detector fails
+                body_result["feature_detection_source"] = "face_analysis"
+                body_result["recognized_features"] = None
+                body_result["features_by_priority"] = None
+                body_result["feature_count"] = None
+                body_result["feature_detector_error"] = str(detector_error)
+        else:
+            body_result["feature_detection_source"] = "face_analysis"
+            body_result["recognized_features"] = None
+            body_result["features_by_priority"] = None
+            body_result["feature_count"] = None
+
+    # Fallback orientation suggestions based on bounding box
+    # Only used if enhanced orientation analysis wasn't performed
+    if "suggested_orientations" not in body_result:
+        dims = body_result["bounding_box"]
+        orientations = []
+
+        # Calculate face areas for stability scoring
+        areas = [dims[a] * dims[b] for _, _, (a, b), _, _ in _BBOX_ORIENTATIONS]
+        total_area = sum(areas)
+
+        # Index of the largest base face (first wins on ties: Z, Y, X)
+        largest = max(range(3), key=areas.__getitem__)
+
+        if total_area > 0:
+            # Area share is weighted 0.8; fold that into one reciprocal
+            area_scale = 0.8 / total_area
+            for idx, (axis, bonus, (base_a, base_b), height_axis, reason) in enumerate(_BBOX_ORIENTATIONS):
+                orientations.append({
+                    "axis": axis,
+                    "score": round(areas[idx] * area_scale + bonus, 2),
+                    "reason": reason + (" (largest face)" if idx == largest else ""),
+                    "base_dimensions": f"{dims[base_a]}x{dims[base_b]}mm",
+                    "height": f"{dims[height_axis]}mm"
+                })
+
+        # Sort by score
+        orientations.sort(key=lambda x: x["score"], reverse=True)
+        body_result["suggested_orientations"] = orientations
+        body_result["orientation_analysis_source"] = "bounding_box"
+
+    return body_result
+
+
 def handle_analyze_geometry_for_cam(arguments: dict) -> dict:
     """
     Analyze part geometry for CAM manufacturability.
@@ -677,6 +1350,10 @@ def handle_analyze_geometry_for_cam(arguments: dict) -> dict:
     Arguments:
         body_names (list, optional): Specific bodies to analyze
         analysis_type (str): "full", "quick", or "features_only"
+        max_features (int, optional): Max face features returned per body (default 20).
+            Face counters and min radius cover every scanned face.
+        max_faces (int, optional): Max faces scanned per body (default 5000).
+            Bodies with more faces report faces_scanned_truncated.
 
     Returns:
         {
@@ -702,296 +1379,41 @@ def handle_analyze_geometry_for_cam(arguments: dict) -> dict:
         root_comp = design.rootComponent
         body_names = arguments.get('body_names', [])
         analysis_type = arguments.get('analysis_type', 'full')
+        max_features = arguments.get('max_features', DEFAULT_MAX_FACE_FEATURES)
+        max_faces = arguments.get('max_faces', DEFAULT_MAX_FACES_SCANNED)
 
-        # Get bodies to analyze
-        bodies = []
-        if body_names:
-            for body in root_comp.bRepBodies:
-                if body.name in body_names:
-                    bodies.append(body)
-        else:
-            bodies = list(root_comp.bRepBodies)
+        # Get bodies to analyze (single pass, set lookup for name filter)
+        name_filter = set(body_names) if body_names else None
+        bodies = [
+            body for body in root_comp.bRepBodies
+            if name_filter is None or body.name in name_filter
+        ]
 
         if not bodies:
             return _format_error("No bodies found to analyze.")
 
-        results = []
+        # Serialize each body result as soon as it is built so only the JSON
+        # text is kept, not every body's dict tree
+        result_texts = []
 
         for body in bodies:
             try:
-                bbox = body.boundingBox
-
-                # Basic measurements (convert cm to mm)
-                body_result = {
-                    "name": body.name,
-                    "bounding_box": {
-                        "x": round((bbox.maxPoint.x - bbox.minPoint.x) * 10, 2),
-                        "y": round((bbox.maxPoint.y - bbox.minPoint.y) * 10, 2),
-                        "z": round((bbox.maxPoint.z - bbox.minPoint.z) * 10, 2),
-                        "min_point": {
-                            "x": round(bbox.minPoint.x * 10, 2),
-                            "y": round(bbox.minPoint.y * 10, 2),
-                            "z": round(bbox.minPoint.z * 10, 2)
-                        },
-                        "max_point": {
-                            "x": round(bbox.maxPoint.x * 10, 2),
-                            "y": round(bbox.maxPoint.y * 10, 2),
-                            "z": round(bbox.maxPoint.z * 10, 2)
-                        },
-                        "unit": "mm"
-                    },
-                    "volume_mm3": round(body.volume * 1000, 2),  # cm³ to mm³
-                    "surface_area_mm2": round(body.surfaceArea * 100, 2),  # cm² to mm²
-                }
-
-                # Material info if available
-                if body.material:
-                    body_result["material"] = body.material.name
-                if body.appearance:
-                    body_result["appearance"] = body.appearance.name
-
-                # Feature analysis (if not quick mode)
-                if analysis_type in ['full', 'features_only']:
-                    features = []
-                    min_radius = float('inf')
-                    face_count = 0
-                    planar_count = 0
-                    cylindrical_count = 0
-
-                    for face in body.faces:
-                        face_count += 1
-                        geom = face.geometry
-
-                        # Detect cylindrical features (holes, bosses)
-                        if isinstance(geom, adsk.core.Cylinder):
-                            radius_mm = geom.radius * 10
-                            if radius_mm < min_radius:
-                                min_radius = radius_mm
-                            cylindrical_count += 1
-
-                            # Determine if it's likely a hole (internal) or boss (external)
-                            # by checking the face normal direction relative to axis
-                            features.append({
-                                "type": "cylindrical",
-                                "radius_mm": round(radius_mm, 3),
-                                "diameter_mm": round(radius_mm * 2, 3)
-                            })
-
-                        # Detect planar faces
-                        elif isinstance(geom, adsk.core.Plane):
-                            planar_count += 1
-                            area_mm2 = face.area * 100
-
-                            # Only record significant planar faces
-                            if area_mm2 > 10:
-                                # Get face normal to determine orientation
-                                evaluator = face.evaluator
-                                _, normal = evaluator.getNormalAtPoint(face.pointOnFace)
-
-                                features.append({
-                                    "type": "planar",
-                                    "area_mm2": round(area_mm2, 2),
-                                    "normal": {
-                                        "x": round(normal.x, 3),
-                                        "y": round(normal.y, 3),
-                                        "z": round(normal.z, 3)
-                                    }
-                                })
-
-                        # Detect conical features
-                        elif isinstance(geom, adsk.core.Cone):
-                            features.append({
-                                "type": "conical",
-                                "half_angle": round(geom.halfAngle * 180 / 3.14159, 2)
-                            })
-
-                        # Detect spherical features
-                        elif isinstance(geom, adsk.core.Sphere):
-                            features.append({
-                                "type": "spherical",
-                                "radius_mm": round(geom.radius * 10, 3)
-                            })
-
-                        # Detect toroidal features (fillets, rounds)
-                        elif isinstance(geom, adsk.core.Torus):
-                            minor_radius = geom.minorRadius * 10
-                            if minor_radius < min_radius:
-                                min_radius = minor_radius
-                            features.append({
-                                "type": "toroidal",
-                                "minor_radius_mm": round(minor_radius, 3),
-                                "major_radius_mm": round(geom.majorRadius * 10, 3)
-                            })
-
-                    body_result["face_count"] = face_count
-                    body_result["feature_summary"] = {
-                        "planar_faces": planar_count,
-                        "cylindrical_faces": cylindrical_count,
-                        "total_features_detected": len(features)
-                    }
-
-                    # Keep face-based features for backward compatibility
-                    body_result["face_features"] = features[:20]
-                    if len(features) > 20:
-                        body_result["face_features_truncated"] = True
-                        body_result["total_face_features"] = len(features)
-
-                    body_result["min_internal_radius_mm"] = round(min_radius, 3) if min_radius != float('inf') else None
-
-                    # Use FeatureDetector for production-ready feature recognition
-                    # Provides holes and pockets/slots from Fusion's RecognizedHole/RecognizedPocket APIs
-                    if FEATURE_DETECTOR_AVAILABLE and analysis_type == 'full':
-                        try:
-                            detector = FeatureDetector()
-                            if detector.is_available:
-                                # Detect holes using Fusion's RecognizedHole API
-                                detected_holes = detector.detect_holes(body)
-
-                                # Detect pockets/slots using Fusion's RecognizedPocket API
-                                # Note: slots are classified by aspect_ratio > 3.0
-                                detected_pockets = detector.detect_pockets(body)
-
-                                # Combine all recognized features for priority grouping
-                                all_recognized_features = detected_holes + detected_pockets
-
-                                # Count features by type (holes, pockets, slots)
-                                hole_count = len([f for f in detected_holes if f.get("type") == "hole"])
-                                pocket_count = len([f for f in detected_pockets if f.get("type") == "pocket"])
-                                slot_count = len([f for f in detected_pockets if f.get("type") == "slot"])
-
-                                # Group features by machining priority (drilling, roughing, finishing)
-                                features_by_priority = _group_by_machining_priority(all_recognized_features)
-
-                                # Add recognized features to result
-                                body_result["recognized_features"] = {
-                                    "holes": detected_holes,
-                                    "pockets": [p for p in detected_pockets if p.get("type") == "pocket"],
-                                    "slots": [s for s in detected_pockets if s.get("type") == "slot"],
-                                    "total_holes": hole_count,
-                                    "total_pockets": pocket_count,
-                                    "total_slots": slot_count
-                                }
-
-                                # Add priority-grouped features for CAM planning
-                                body_result["features_by_priority"] = features_by_priority
-
-                                # Add feature count summary
-                                body_result["feature_count"] = {
-                                    "holes": hole_count,
-                                    "pockets": pocket_count,
-                                    "slots": slot_count,
-                                    "total": len(all_recognized_features)
-                                }
-
-                                body_result["feature_detection_source"] = "fusion_api"
-
-                                # Enhanced orientation analysis with setup sequences
-                                # Uses OrientationAnalyzer when features are available
-                                if all_recognized_features:
-                                    try:
-                                        analyzer = OrientationAnalyzer(all_recognized_features)
-                                        enhanced_orientations = analyzer.suggest_orientations(body)
-                                        body_result["suggested_orientations"] = enhanced_orientations
-                                        body_result["orientation_analysis_source"] = "feature_based"
-                                    except Exception as orient_error:
-                                        body_result["orientation_analysis_error"] = str(orient_error)
-                                        body_result["orientation_analysis_source"] = "bounding_box"
-
-                                # Minimum tool radius calculation with 80% rule
-                                try:
-                                    tool_radius_info = calculate_minimum_tool_radii(
-                                        body, all_recognized_features
-                                    )
-                                    body_result["minimum_tool_radius"] = tool_radius_info
-                                except Exception as radius_error:
-                                    body_result["minimum_tool_radius"] = {
-                                        "error": str(radius_error),
-                                        "global_minimum_radius": None,
-                                        "recommended_tool_radius": None
-                                    }
-                            else:
-                                body_result["feature_detection_source"] = "face_analysis"
-                                body_result["recognized_features"] = None
-                                body_result["features_by_priority"] = None
-                                body_result["feature_count"] = None
-                        except Exception as detector_error:
-                            # Fallback to face analysis if detector fails
-                            body_result["feature_detection_source"] = "face_analysis"
-                            body_result["recognized_features"] = None
-                            body_result["features_by_priority"] = None
-                            body_result["feature_count"] = None
-                            body_result["feature_detector_error"] = str(detector_error)
-                    else:
-                        body_result["feature_detection_source"] = "face_analysis"
-                        body_result["recognized_features"] = None
-                        body_result["features_by_priority"] = None
-                        body_result["feature_count"] = None
-
-                # Fallback orientation suggestions based on bounding box
-                # Only used if enhanced orientation analysis wasn't performed
-                if "suggested_orientations" not in body_result:
-                    dims = body_result["bounding_box"]
-                    orientations = []
-
-                    # Calculate face areas for stability scoring
-                    xy_area = dims["x"] * dims["y"]
-                    xz_area = dims["x"] * dims["z"]
-                    yz_area = dims["y"] * dims["z"]
-                    total_area = xy_area + xz_area + yz_area
-
-                    if total_area > 0:
-                        # Z-up: XY plane as base
-                        z_up_score = xy_area / total_area * 0.8 + 0.2
-                        orientations.append({
-                            "axis": "Z_UP",
-                            "score": round(z_up_score, 2),
-                            "reason": "XY plane as base" + (" (largest face)" if xy_area >= xz_area and xy_area >= yz_area else ""),
-                            "base_dimensions": f"{dims['x']}x{dims['y']}mm",
-                            "height": f"{dims['z']}mm"
-                        })
-
-                        # Y-up: XZ plane as base
-                        y_up_score = xz_area / total_area * 0.8 + 0.1
-                        orientations.append({
-                            "axis": "Y_UP",
-                            "score": round(y_up_score, 2),
-                            "reason": "XZ plane as base" + (" (largest face)" if xz_area > xy_area and xz_area >= yz_area else ""),
-                            "base_dimensions": f"{dims['x']}x{dims['z']}mm",
-                            "height": f"{dims['y']}mm"
-                        })
-
-                        # X-up: YZ plane as base
-                        x_up_score = yz_area / total_area * 0.8
-                        orientations.append({
-                            "axis": "X_UP",
-                            "score": round(x_up_score, 2),
-                            "reason": "YZ plane as base" + (" (largest face)" if yz_area > xy_area and yz_area > xz_area else ""),
-                            "base_dimensions": f"{dims['y']}x{dims['z']}mm",
-                            "height": f"{dims['x']}mm"
-                        })
-
-                    # Sort by score
-                    orientations.sort(key=lambda x: x["score"], reverse=True)
-                    body_result["suggested_orientations"] = orientations
-                    body_result["orientation_analysis_source"] = "bounding_box"
-
-                results.append(body_result)
-
+                body_result = _analyze_body(body, analysis_type, max_features, max_faces)
             except Exception as body_error:
-                results.append({
+                body_result = {
                     "name": body.name,
                     "error": str(body_error)
-                })
+                }
+            result_texts.append(_dumps(body_result))
 
-        return _format_response({
-            "bodies_analyzed": len(results),
-            "analysis_type": analysis_type,
-            "results": results
-        })
+        header = {
+            "bodies_analyzed": len(result_texts),
+            "analysis_type": analysis_type
+        }
+        return _format_response("".join(_iter_json_with_list(header, "results", result_texts)))
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to analyze geometry: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to analyze geometry: {str(e)}", _exception_details())
 
 
 # =============================================================================
@@ -1182,21 +1604,23 @@ def handle_suggest_stock_setup(arguments: dict) -> dict:
         if FEEDBACK_LEARNING_AVAILABLE and mcp_call_func:
             try:
                 initialize_feedback_schema(mcp_call_func)
-                feedback_history = get_matching_feedback(
+                acceptance_rate, weighted_count, sample_count = get_weighted_acceptance_rate_sql(
                     operation_type="stock_setup",
                     material=material,
                     geometry_type=geometry_type,
                     limit=50,
                     mcp_call_func=mcp_call_func
                 )
-                if feedback_history:
+                if sample_count:
                     base_confidence = 0.8  # Default stock suggestion confidence
-                    adjusted_confidence, learning_source = adjust_confidence_from_feedback(
+                    adjusted_confidence, learning_source = adjust_confidence_from_rate(
                         base_confidence=base_confidence,
-                        feedback_history=feedback_history
+                        acceptance_rate=acceptance_rate,
+                        sample_count=weighted_count,
+                        match_count=sample_count
                     )
                     learning_metadata = {
-                        "sample_count": len(feedback_history),
+                        "sample_count": sample_count,
                         "adjusted_confidence": adjusted_confidence,
                         "source": learning_source
                     }
@@ -1204,7 +1628,7 @@ def handle_suggest_stock_setup(arguments: dict) -> dict:
                     if learning_source.startswith("user_preference"):
                         source = f"from: {learning_source}"
                     # First-time learning notification
-                    if should_notify_learning(feedback_history):
+                    if should_notify_learning(sample_count):
                         learning_metadata["notification"] = (
                             f"I noticed patterns in your preferences for {material}. "
                             "Future suggestions will reflect what you've chosen before."
@@ -1400,8 +1824,7 @@ def handle_suggest_stock_setup(arguments: dict) -> dict:
         return _format_response(response)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to suggest stock setup: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to suggest stock setup: {str(e)}", _exception_details())
 
 
 # =============================================================================
@@ -1675,26 +2098,28 @@ def handle_suggest_toolpath_strategy(arguments: dict) -> dict:
         if FEEDBACK_LEARNING_AVAILABLE and mcp_call_func:
             try:
                 initialize_feedback_schema(mcp_call_func)
-                feedback_history = get_matching_feedback(
+                acceptance_rate, weighted_count, sample_count = get_weighted_acceptance_rate_sql(
                     operation_type="toolpath_strategy",
                     material=material,
                     geometry_type=geometry_type,
                     limit=50,
                     mcp_call_func=mcp_call_func
                 )
-                if feedback_history:
+                if sample_count:
                     base_confidence = 0.8  # Default toolpath strategy confidence
-                    adjusted_confidence, learning_source = adjust_confidence_from_feedback(
+                    adjusted_confidence, learning_source = adjust_confidence_from_rate(
                         base_confidence=base_confidence,
-                        feedback_history=feedback_history
+                        acceptance_rate=acceptance_rate,
+                        sample_count=weighted_count,
+                        match_count=sample_count
                     )
                     learning_metadata = {
-                        "sample_count": len(feedback_history),
+                        "sample_count": sample_count,
                         "adjusted_confidence": adjusted_confidence,
                         "source": learning_source
                     }
                     # First-time learning notification
-                    if should_notify_learning(feedback_history):
+                    if should_notify_learning(sample_count):
                         learning_metadata["notification"] = (
                             f"I noticed patterns in your preferences for {material}. "
                             "Future suggestions will reflect what you've chosen before."
@@ -1857,8 +2282,7 @@ def handle_suggest_toolpath_strategy(arguments: dict) -> dict:
         return _format_response(response)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to suggest toolpath strategy: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to suggest toolpath strategy: {str(e)}", _exception_details())
 
 
 # =============================================================================
@@ -2008,8 +2432,7 @@ def handle_record_user_choice(arguments: dict) -> dict:
         return _format_response(response)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to record user choice: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to record user choice: {str(e)}", _exception_details())
 
 
 def handle_get_feedback_stats(arguments: dict) -> dict:
@@ -2050,8 +2473,7 @@ def handle_get_feedback_stats(arguments: dict) -> dict:
         return _format_response(stats)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to get feedback stats: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to get feedback stats: {str(e)}", _exception_details())
 
 
 def handle_export_feedback_history(arguments: dict) -> dict:
@@ -2097,8 +2519,7 @@ def handle_export_feedback_history(arguments: dict) -> dict:
         return _format_response(response)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to export feedback history: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to export feedback history: {str(e)}", _exception_details())
 
 
 def handle_clear_feedback_history(arguments: dict) -> dict:
@@ -2142,48 +2563,57 @@ def handle_clear_feedback_history(arguments: dict) -> dict:
         operation_type = arguments.get('operation_type')
 
         # Clear history
-        deleted_count = clear_feedback_history(operation_type, mcp_call_func)
+        cleared = clear_feedback_history(operation_type, mcp_call_func)
+        if not cleared.get("success", True):
+            return _format_error(
+                "Failed to clear feedback history",
+                cleared.get("error")
+            )
 
         response = {
             "status": "success",
-            "deleted_count": deleted_count,
+            "deleted_count": cleared.get("deleted_count", 0),
             "operation_type": operation_type if operation_type else "all"
         }
 
         return _format_response(response)
 
     except Exception as e:
-        import traceback
-        return _format_error(f"Failed to clear feedback history: {str(e)}", traceback.format_exc())
+        return _format_error(f"Failed to clear feedback history: {str(e)}", _exception_details())
 
 
 # =============================================================================
 # OPERATION ROUTER
 # =============================================================================
 
+# Operation name -> handler, built once at import (read-only view)
+_CAM_OPERATION_HANDLERS = types.MappingProxyType({
+    'get_cam_state': handle_get_cam_state,
+    'get_tool_library': handle_get_tool_library,
+    'analyze_geometry_for_cam': handle_analyze_geometry_for_cam,
+    'suggest_stock_setup': handle_suggest_stock_setup,
+    'suggest_toolpath_strategy': handle_suggest_toolpath_strategy,
+    'record_user_choice': handle_record_user_choice,
+    'get_feedback_stats': handle_get_feedback_stats,
+    'export_feedback_history': handle_export_feedback_history,
+    'clear_feedback_history': handle_clear_feedback_history,
+    # Phase 6+
+    # 'suggest_post_processor': handle_suggest_post_processor,
+})
+
+# Static detail text for the unknown-operation error
+_AVAILABLE_OPERATIONS_MESSAGE = f"Available operations: {list(_CAM_OPERATION_HANDLERS.keys())}"
+
+
 def route_cam_operation(operation: str, arguments: dict) -> dict:
     """
     Route CAM operation to appropriate handler.
 
     Called from mcp_integration.py for CAM-specific operations.
     """
-    handlers = {
-        'get_cam_state': handle_get_cam_state,
-        'get_tool_library': handle_get_tool_library,
-        'analyze_geometry_for_cam': handle_analyze_geometry_for_cam,
-        'suggest_stock_setup': handle_suggest_stock_setup,
-        'suggest_toolpath_strategy': handle_suggest_toolpath_strategy,
-        'record_user_choice': handle_record_user_choice,
-        'get_feedback_stats': handle_get_feedback_stats,
-        'export_feedback_history': handle_export_feedback_history,
-        'clear_feedback_history': handle_clear_feedback_history,
-        # Phase 6+
-        # 'suggest_post_processor': handle_suggest_post_processor,
-    }
-
-    handler = handlers.get(operation)
+    handler = _CAM_OPERATION_HANDLERS.get(operation)
     if handler:
         return handler(arguments)
     else:
         return _format_error(f"Unknown CAM operation: {operation}",
-                           f"Available operations: {list(handlers.keys())}")
+                           _AVAILABLE_OPERATIONS_MESSAGE)
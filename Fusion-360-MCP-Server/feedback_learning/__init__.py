@@ -61,8 +61,11 @@ Example:
 from .feedback_store import (
     initialize_feedback_schema,
     record_feedback,
+    flush_feedback,
     get_feedback_statistics,
     export_feedback_history,
+    iter_feedback_history,
+    export_feedback_history_all,
     clear_feedback_history,
     FEEDBACK_HISTORY_SCHEMA
 )
@@ -72,22 +75,29 @@ from .recency_weighting import (
 )
 from .confidence_adjuster import (
     adjust_confidence_from_feedback,
+    adjust_confidence_from_rate,
     should_notify_learning,
+    should_notify_learning_list,
     MIN_SAMPLES,
     CONFIDENCE_FLOOR,
     TENTATIVE_THRESHOLD
 )
 from .context_matcher import (
     get_matching_feedback,
-    get_conflicting_choices
+    get_conflicting_choices,
+    get_conflicting_choices_sql,
+    get_weighted_acceptance_rate_sql
 )
 
 __all__ = [
     # Feedback storage
     "initialize_feedback_schema",
     "record_feedback",
+    "flush_feedback",
     "get_feedback_statistics",
     "export_feedback_history",
+    "iter_feedback_history",
+    "export_feedback_history_all",
     "clear_feedback_history",
     "FEEDBACK_HISTORY_SCHEMA",
     # Recency weighting
@@ -95,11 +105,15 @@ __all__ = [
     "get_weighted_acceptance_rate",
     # Confidence adjustment
     "adjust_confidence_from_feedback",
+    "adjust_confidence_from_rate",
     "should_notify_learning",
+    "should_notify_learning_list",
     "MIN_SAMPLES",
     "CONFIDENCE_FLOOR",
     "TENTATIVE_THRESHOLD",
     # Context matching
     "get_matching_feedback",
     "get_conflicting_choices",
+    "get_conflicting_choices_sql",
+    "get_weighted_acceptance_rate_sql",
 ]
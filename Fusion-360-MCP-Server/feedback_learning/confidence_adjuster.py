@@ -13,7 +13,9 @@ Per CONTEXT.md:
 
 Functions:
     adjust_confidence_from_feedback: Blend base confidence with acceptance rate
+    adjust_confidence_from_rate: Same blend from an already computed acceptance rate
     should_notify_learning: Check if just crossed learning threshold
+    should_notify_learning_list: Same check taking the feedback history list
 """
 
 from typing import List, Dict, Any, Tuple
@@ -36,6 +38,9 @@ FULL_TRUST_SAMPLES = 10
 # Flag as tentative below this threshold (CONTEXT.md decision)
 TENTATIVE_THRESHOLD = 0.60
 
+# Blend weight per sample count: linear ramp to 1.0 at FULL_TRUST_SAMPLES
+_SAMPLE_WEIGHTS = tuple(n / FULL_TRUST_SAMPLES for n in range(FULL_TRUST_SAMPLES + 1))
+
 
 # =============================================================================
 # CONFIDENCE ADJUSTMENT
@@ -79,16 +84,53 @@ def adjust_confidence_from_feedback(
         halflife_days
     )
 
+    return _blend_confidence(base_confidence, acceptance_rate, sample_count)
+
+
+def adjust_confidence_from_rate(
+    base_confidence: float,
+    acceptance_rate: float,
+    sample_count: int,
+    match_count: int,
+    min_samples: int = MIN_SAMPLES
+) -> Tuple[float, str]:
+    """
+    Adjust confidence score from an already computed acceptance rate.
+
+    Same result as adjust_confidence_from_feedback() for the rate returned
+    by get_weighted_acceptance_rate_sql(), without the history rows.
+
+    Args:
+        base_confidence: Default confidence from rules (0.0 to 1.0)
+        acceptance_rate: Weighted acceptance rate (0.0 to 1.0)
+        sample_count: Sample count returned with the acceptance rate
+        match_count: Number of matching feedback events (len of the history)
+        min_samples: Minimum samples required before adjusting (default: MIN_SAMPLES=3)
+
+    Returns:
+        Tuple of (adjusted_confidence, source_tag), as adjust_confidence_from_feedback()
+    """
+    # If insufficient samples, return base confidence unchanged
+    if match_count < min_samples:
+        return (base_confidence, "default_rules")
+
+    return _blend_confidence(base_confidence, acceptance_rate, sample_count)
+
+
+def _blend_confidence(
+    base_confidence: float,
+    acceptance_rate: float,
+    sample_count: int
+) -> Tuple[float, str]:
+    """Blend base confidence with an acceptance rate and tag the source."""
     # Calculate blend weight based on sample count
     # Linear ramp from 0.0 at min_samples to 1.0 at FULL_TRUST_SAMPLES
-    sample_weight = min(1.0, sample_count / FULL_TRUST_SAMPLES)
+    sample_weight = _SAMPLE_WEIGHTS[min(sample_count, FULL_TRUST_SAMPLES)]
 
-    # Blend base confidence with acceptance rate
+    # Blend base confidence with acceptance rate, then apply confidence
+    # floor to prevent death spiral
     # adjusted = base * (1 - weight) + acceptance * weight
-    adjusted = base_confidence * (1 - sample_weight) + acceptance_rate * sample_weight
-
-    # Apply confidence floor to prevent death spiral
-    adjusted = max(CONFIDENCE_FLOOR, adjusted)
+    adjusted = max(CONFIDENCE_FLOOR, base_confidence + (acceptance_rate - base_confidence) * sample_weight)
 
     # Determine source tag
     if adjusted < TENTATIVE_THRESHOLD:
@@ -102,22 +144,35 @@ def adjust_confidence_from_feedback(
     return (adjusted, source_tag)
 
 
-def should_notify_learning(feedback_history: List[Dict[str, Any]]) -> bool:
+def should_notify_learning(sample_count: int) -> bool:
     """
     Check if we just crossed the learning threshold.
 
-    Returns True when feedback_history length exactly equals MIN_SAMPLES,
+    Returns True when the feedback sample count exactly equals MIN_SAMPLES,
     indicating this is the first time we have enough data to learn.
 
     Args:
-        feedback_history: List of feedback event dicts
+        sample_count: Number of matching feedback events (len of the history)
 
     Returns:
         True if just crossed MIN_SAMPLES threshold, False otherwise
 
     Example:
         >>> history = [event1, event2, event3]
-        >>> if should_notify_learning(history):
+        >>> if should_notify_learning(len(history)):
         ...     print("Learning now active for this context!")
     """
-    return len(feedback_history) == MIN_SAMPLES
+    return sample_count == MIN_SAMPLES
+
+
+def should_notify_learning_list(feedback_history: List[Dict[str, Any]]) -> bool:
+    """
+    Back-compat form of should_notify_learning() taking the history list.
+
+    Args:
+        feedback_history: List of feedback event dicts
+
+    Returns:
+        True if just crossed MIN_SAMPLES threshold, False otherwise
+    """
+    return should_notify_learning(len(feedback_history))
@@ -5,49 +5,222 @@ Provides field-based querying of feedback history and conflict detection.
 Matches feedback events by operation_type, material family, and geometry_type.
 
 Per CONTEXT.md:
-- Material family matching using LIKE (partial matching)
+- Material family matching on the indexed material_family column
+  (GLOB partial matching for materials outside known families)
 - Lowercase normalization for consistent keying
 - Conflict detection for showing multiple choice alternatives
 
 Functions:
     get_matching_feedback: Query feedback by operation_type + material + geometry_type
     get_conflicting_choices: Detect conflicting user choices in feedback history
+    get_conflicting_choices_sql: Same detection, grouped inside SQLite
+    get_weighted_acceptance_rate_sql: Recency-weighted acceptance rate computed in SQLite
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Tuple
+import heapq
 import json
 
+# Optional fast JSON parser; falls back to stdlib json when not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast 64-bit hash for choice grouping keys; without it the
+# canonical JSON itself is the key
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 
 # MCP bridge SQLite tool unlock token (from sqlite MCP server docs)
 SQLITE_TOOL_UNLOCK_TOKEN = "8d8f7853"
 
 # Import database constant and helper from feedback_store
-from .feedback_store import CAM_FEEDBACK_DATABASE, _unwrap_mcp_result
+from .feedback_store import CAM_FEEDBACK_DATABASE, _unwrap_mcp_result, _sqlite_error, _material_family, _normalize_key
+from .recency_weighting import get_weighted_acceptance_rate, _decay_lambda
 
 
 # =============================================================================
 # FEEDBACK MATCHING
 # =============================================================================
 
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _canonical_choice(user_choice: Any) -> bytes:
+        """Canonical form of a user choice (sorted-key JSON bytes)."""
+        try:
+            return orjson.dumps(user_choice, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. non-str keys) that json accepts
+            return json.dumps(user_choice, sort_keys=True).encode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _canonical_choice(user_choice: Any) -> bytes:
+        """Canonical form of a user choice (sorted-key JSON bytes)."""
+        return json.dumps(user_choice, sort_keys=True).encode("utf-8")
+
+
+if XXHASH_AVAILABLE:
+    def _choice_key(user_choice: Any) -> int:
+        """Grouping key for a user choice: 64-bit hash of its canonical JSON."""
+        return xxhash.xxh64(_canonical_choice(user_choice)).intdigest()
+else:
+    # Fusion's bundled Python has no xxhash: group on the canonical bytes
+    # directly, which costs no extra hashing and cannot collide
+    _choice_key = _canonical_choice
+
+
+# Columns returned by get_matching_feedback, in SELECT (row position) order
+FEEDBACK_COLUMNS = (
+    "id", "operation_type", "material", "geometry_type",
+    "context_snapshot", "suggestion_payload", "user_choice",
+    "feedback_type", "feedback_note", "confidence_before", "created_at",
+)
+
+# JSON text columns of cam_feedback_history
+_JSON_COLUMNS = ("context_snapshot", "suggestion_payload", "user_choice")
+
+
+def _apply_extracted(event: Dict[str, Any], extracted: List[tuple], values) -> None:
+    """Rebuild nested dicts on event from flat json_extract() column values."""
+    for column in {column for _, column, _ in extracted}:
+        event[column] = {}
+    for (_, column, parts), value in zip(extracted, values):
+        target = event[column]
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+
+
+def _event_from_dict_row(row: Dict[str, Any], extracted: List[tuple]) -> Optional[Dict[str, Any]]:
+    """Build a feedback event from a dict-format result row."""
+    event = {
+        "id": row.get("id"),
+        "operation_type": row.get("operation_type"),
+        "material": row.get("material"),
+        "geometry_type": row.get("geometry_type"),
+        "feedback_type": row.get("feedback_type"),
+        "feedback_note": row.get("feedback_note"),
+        "confidence_before": row.get("confidence_before"),
+        "created_at": row.get("created_at")
+    }
+    # Parse JSON fields (empty/NULL columns skip the parser)
+    try:
+        context_str = row.get("context_snapshot")
+        event["context_snapshot"] = _json_loads(context_str) if context_str else {}
+    except (ValueError, TypeError):
+        event["context_snapshot"] = {}
+    try:
+        suggestion_str = row.get("suggestion_payload")
+        event["suggestion_payload"] = _json_loads(suggestion_str) if suggestion_str else {}
+    except (ValueError, TypeError):
+        event["suggestion_payload"] = {}
+    try:
+        user_choice_str = row.get("user_choice")
+        event["user_choice"] = _json_loads(user_choice_str) if user_choice_str else None
+    except (ValueError, TypeError):
+        event["user_choice"] = None
+
+    if extracted:
+        _apply_extracted(event, extracted, [row.get(alias) for alias, _, _ in extracted])
+
+    return event
+
+
+def _event_from_list_row(row, extracted: List[tuple]) -> Optional[Dict[str, Any]]:
+    """Build a feedback event from a list-format result row (FEEDBACK_COLUMNS order)."""
+    if len(row) < 11 + len(extracted):
+        return None
+
+    event = {
+        "id": row[0],
+        "operation_type": row[1],
+        "material": row[2],
+        "geometry_type": row[3],
+        "feedback_type": row[7],
+        "feedback_note": row[8],
+        "confidence_before": row[9],
+        "created_at": row[10]
+    }
+    # Parse JSON fields
+    try:
+        event["context_snapshot"] = _json_loads(row[4]) if row[4] else {}
+    except (ValueError, TypeError):
+        event["context_snapshot"] = {}
+    try:
+        event["suggestion_payload"] = _json_loads(row[5]) if row[5] else {}
+    except (ValueError, TypeError):
+        event["suggestion_payload"] = {}
+    try:
+        event["user_choice"] = _json_loads(row[6]) if row[6] else None
+    except (ValueError, TypeError):
+        event["user_choice"] = None
+
+    if extracted:
+        _apply_extracted(event, extracted, row[11:])
+
+    return event
+
+
+def _glob_escape(text: str) -> str:
+    """Escape GLOB metacharacters (* ? [) so text matches literally."""
+    return text.replace("[", "[[]").replace("*", "[*]").replace("?", "[?]")
+
+
+def _material_predicate(material_key: str) -> tuple:
+    """
+    Build the SQL material filter for a normalized material name.
+
+    Returns:
+        Tuple of (predicate using the :material binding, binding value)
+    """
+    material_family = _material_family(material_key)
+    if material_family:
+        # Indexed equality on (operation_type, material_family, geometry_type)
+        return ("material_family = :material", material_family)
+
+    # Unknown family: substring match. Stored materials are already
+    # lowercased, so case-sensitive GLOB (BINARY collation) suffices and
+    # skips LIKE's per-character case folding
+    return ("material GLOB :material", f"*{_glob_escape(material_key)}*")
+
+
 def get_matching_feedback(
     operation_type: str,
     material: str,
     geometry_type: str,
     limit: int = 50,
-    mcp_call_func: Callable = None
+    mcp_call_func: Callable = None,
+    fields: Optional[Dict[str, List[str]]] = None,
+    columns: Optional[Iterable[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Query feedback history matching operation_type, material family, and geometry_type.
 
-    Uses LIKE for material matching to support partial matches (e.g., "6061 aluminum"
-    matches "aluminum" family).
+    Materials in a known family match on the indexed material_family column
+    (e.g., "6061 aluminum" and "aluminum" are both the "aluminum" family).
+    Other materials fall back to GLOB partial matching on the material name.
 
     Args:
         operation_type: Operation type to match exactly
-        material: Material name (will be normalized to lowercase, matched with LIKE)
+        material: Material name (will be normalized to lowercase and mapped to its family)
         geometry_type: Geometry type to match exactly (normalized to lowercase)
         limit: Maximum number of rows to return (default: 50)
         mcp_call_func: MCP call function for SQLite operations
+        fields: Optional JSON fields to extract in SQLite instead of parsing whole
+                columns, e.g. {"context_snapshot": ["bounding_box.x", "bounding_box.y"]}.
+                Listed columns come back holding only those (scalar) fields.
+        columns: Optional subset of FEEDBACK_COLUMNS to fetch, e.g.
+                 ("feedback_type", "created_at") for confidence scoring. Other
+                 columns aren't transferred or parsed and are left out of the
+                 returned events. Default: all columns.
 
     Returns:
         List of feedback event dicts with parsed JSON fields, ordered by created_at DESC.
@@ -64,95 +237,84 @@ def get_matching_feedback(
         >>> print(f"Found {len(matching)} matching events")
     """
     # Normalize material and geometry_type to lowercase
-    material_key = material.lower().strip()
-    geometry_key = geometry_type.lower().strip()
+    material_key = _normalize_key(material)
+    geometry_key = _normalize_key(geometry_type)
+    material_predicate, material_binding = _material_predicate(material_key)
+
+    bindings = {
+        "operation_type": operation_type,
+        "material": material_binding,
+        "geometry_type": geometry_key,
+        "limit": limit
+    }
+
+    # Columns selected in full, and json_extract() columns appended after them.
+    # Unrequested and extracted columns are selected as NULL so row positions
+    # stay fixed.
+    selected = None
+    select_exprs = {column: column for column in FEEDBACK_COLUMNS}
+    if columns is not None:
+        requested = set(columns)
+        selected = tuple(column for column in FEEDBACK_COLUMNS if column in requested)
+        for column in FEEDBACK_COLUMNS:
+            if column not in requested:
+                select_exprs[column] = f"NULL AS {column}"
+
+    extracted = []  # (alias, column, path parts)
+    extract_selects = ""
+    if fields:
+        for column, paths in fields.items():
+            if column not in _JSON_COLUMNS or (selected is not None and column not in selected):
+                continue
+            select_exprs[column] = f"NULL AS {column}"
+            for path in paths:
+                alias = f"extract_{len(extracted)}"
+                bindings[f"{alias}_path"] = f"$.{path}"
+                extract_selects += f", json_extract({column}, :{alias}_path) AS {alias}"
+                extracted.append((alias, column, path.split(".")))
 
     try:
-        # Query matching feedback with LIKE for material family matching
+        # Query matching feedback by material family
         result = _unwrap_mcp_result(mcp_call_func("sqlite", {
             "input": {
                 "database": CAM_FEEDBACK_DATABASE,
-                "sql": """
-                    SELECT id, operation_type, material, geometry_type,
-                           context_snapshot, suggestion_payload, user_choice,
-                           feedback_type, feedback_note, confidence_before, created_at
+                "sql": f"""
+                    SELECT {", ".join(select_exprs.values())}
+                           {extract_selects}
                     FROM cam_feedback_history
                     WHERE operation_type = :operation_type
-                      AND material LIKE :material_pattern
+                      AND {material_predicate}
                       AND geometry_type = :geometry_type
                     ORDER BY created_at DESC
                     LIMIT :limit
                 """,
-                "bindings": {
-                    "operation_type": operation_type,
-                    "material_pattern": f"%{material_key}%",  # LIKE pattern for family matching
-                    "geometry_type": geometry_key,
-                    "limit": limit
-                },
+                "bindings": bindings,
                 "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
             }
         }))
 
         feedback_events = []
+        append_event = feedback_events.append
         if result and isinstance(result, dict):
             rows = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
             if rows:
-                for row in rows:
-                    # Handle both dict and list row formats
-                    if isinstance(row, dict):
-                        event = {
-                            "id": row.get("id"),
-                            "operation_type": row.get("operation_type"),
-                            "material": row.get("material"),
-                            "geometry_type": row.get("geometry_type"),
-                            "feedback_type": row.get("feedback_type"),
-                            "feedback_note": row.get("feedback_note"),
-                            "confidence_before": row.get("confidence_before"),
-                            "created_at": row.get("created_at")
-                        }
-                        # Parse JSON fields
-                        try:
-                            event["context_snapshot"] = json.loads(row.get("context_snapshot", "{}"))
-                        except:
-                            event["context_snapshot"] = {}
-                        try:
-                            event["suggestion_payload"] = json.loads(row.get("suggestion_payload", "{}"))
-                        except:
-                            event["suggestion_payload"] = {}
-                        try:
-                            user_choice_str = row.get("user_choice")
-                            event["user_choice"] = json.loads(user_choice_str) if user_choice_str else None
-                        except:
-                            event["user_choice"] = None
-
-                        feedback_events.append(event)
-
-                    elif isinstance(row, (list, tuple)) and len(row) >= 11:
-                        event = {
-                            "id": row[0],
-                            "operation_type": row[1],
-                            "material": row[2],
-                            "geometry_type": row[3],
-                            "feedback_type": row[7],
-                            "feedback_note": row[8],
-                            "confidence_before": row[9],
-                            "created_at": row[10]
-                        }
-                        # Parse JSON fields
-                        try:
-                            event["context_snapshot"] = json.loads(row[4]) if row[4] else {}
-                        except:
-                            event["context_snapshot"] = {}
-                        try:
-                            event["suggestion_payload"] = json.loads(row[5]) if row[5] else {}
-                        except:
-                            event["suggestion_payload"] = {}
-                        try:
-                            event["user_choice"] = json.loads(row[6]) if row[6] else None
-                        except:
-                            event["user_choice"] = None
-
-                        feedback_events.append(event)
+                # A backend returns one row format throughout; pick the
+                # builder once instead of re-testing every row
+                if isinstance(rows[0], dict):
+                    build_event = _event_from_dict_row
+                elif isinstance(rows[0], (list, tuple)):
+                    build_event = _event_from_list_row
+                else:
+                    build_event = None
+
+                if build_event is not None:
+                    for row in rows:
+                        event = build_event(row, extracted)
+                        if event is None:
+                            continue
+                        if selected is not None:
+                            event = {column: event[column] for column in selected}
+                        append_event(event)
 
         return feedback_events
 
@@ -165,7 +327,10 @@ def get_matching_feedback(
 # CONFLICT DETECTION
 # =============================================================================
 
-def get_conflicting_choices(feedback_history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def get_conflicting_choices(
+    feedback_history: List[Dict[str, Any]],
+    top_k: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Detect conflicting user choices in feedback history.
 
@@ -174,9 +339,11 @@ def get_conflicting_choices(feedback_history: List[Dict[str, Any]]) -> List[Dict
 
     Args:
         feedback_history: List of feedback event dicts with user_choice key
+        top_k: Optional number of most popular alternatives to return
+               (default: all)
 
     Returns:
-        List of alternative choice dicts, each with:
+        List of alternative choice dicts, most popular first, each with:
         - choice: The user choice dict
         - count: Number of times this choice was made
         - most_recent_date: ISO timestamp of most recent occurrence
@@ -194,30 +361,26 @@ def get_conflicting_choices(feedback_history: List[Dict[str, Any]]) -> List[Dict
     if not feedback_history:
         return []
 
-    # Group by user_choice (serialize for comparison)
+    # Group by user_choice (serialize for comparison) in one pass:
+    # choice_key -> [count, most_recent_date, choice]
     choice_groups = {}
 
     for event in feedback_history:
         user_choice = event.get("user_choice")
         created_at = event.get("created_at", "")
 
-        # Serialize choice for grouping (None becomes "null")
-        choice_key = json.dumps(user_choice, sort_keys=True)
-
-        if choice_key not in choice_groups:
-            choice_groups[choice_key] = {
-                "choice": user_choice,
-                "count": 0,
-                "most_recent_date": created_at,
-                "events": []
-            }
-
-        choice_groups[choice_key]["count"] += 1
-        choice_groups[choice_key]["events"].append(event)
+        # Key from the canonical JSON (None is "null"); the first payload
+        # seen is kept in the group for output
+        choice_key = _choice_key(user_choice)
 
-        # Update most recent date
-        if created_at > choice_groups[choice_key]["most_recent_date"]:
-            choice_groups[choice_key]["most_recent_date"] = created_at
+        group = choice_groups.get(choice_key)
+        if group is None:
+            choice_groups[choice_key] = [1, created_at, user_choice]
+        else:
+            group[0] += 1
+            # Update most recent date
+            if created_at > group[1]:
+                group[1] = created_at
 
     # If only one distinct choice (or all None), no conflict
     if len(choice_groups) <= 1:
@@ -225,16 +388,228 @@ def get_conflicting_choices(feedback_history: List[Dict[str, Any]]) -> List[Dict
 
     # Calculate weighted scores for ranking
     # For now, simple score = count (could enhance with recency weighting)
-    alternatives = []
-    for choice_key, group in choice_groups.items():
-        alternatives.append({
-            "choice": group["choice"],
-            "count": group["count"],
-            "most_recent_date": group["most_recent_date"],
-            "weighted_score": group["count"]  # Simple count-based score
-        })
-
-    # Sort by weighted_score descending (most popular first)
+    alternatives = [
+        {
+            "choice": choice,
+            "count": count,
+            "most_recent_date": most_recent_date,
+            "weighted_score": count  # Simple count-based score
+        }
+        for count, most_recent_date, choice in choice_groups.values()
+    ]
+
+    # Sort by weighted_score descending (most popular first); a partial
+    # selection is enough when only the top few are shown
+    if top_k is not None:
+        return heapq.nlargest(top_k, alternatives, key=lambda x: x["weighted_score"])
+
     alternatives.sort(key=lambda x: x["weighted_score"], reverse=True)
 
     return alternatives
+
+
+def get_conflicting_choices_sql(
+    operation_type: str,
+    material: str,
+    geometry_type: str,
+    mcp_call_func: Callable = None
+) -> List[Dict[str, Any]]:
+    """
+    Detect conflicting user choices with the grouping done in SQLite.
+
+    user_choice is stored as sorted-key JSON, so identical choices have
+    identical text and GROUP BY user_choice groups them without fetching
+    every event. Only one JSON value per distinct choice is parsed.
+
+    Unlike get_conflicting_choices(), this covers all matching feedback
+    rather than a fetched (limited) history.
+
+    Args:
+        operation_type: Operation type to match exactly
+        material: Material name (matched like get_matching_feedback)
+        geometry_type: Geometry type to match exactly (normalized to lowercase)
+        mcp_call_func: MCP call function for SQLite operations
+
+    Returns:
+        List of alternative choice dicts (same shape as get_conflicting_choices),
+        most popular first. Returns empty list if no conflicts or on error.
+
+    Example:
+        >>> conflicts = get_conflicting_choices_sql(
+        ...     "toolpath_strategy", "aluminum", "pocket-heavy", mcp_call_func=mcp_call
+        ... )
+    """
+    material_key = _normalize_key(material)
+    geometry_key = _normalize_key(geometry_type)
+    material_predicate, material_binding = _material_predicate(material_key)
+
+    try:
+        result = _unwrap_mcp_result(mcp_call_func("sqlite", {
+            "input": {
+                "database": CAM_FEEDBACK_DATABASE,
+                "sql": f"""
+                    SELECT user_choice, COUNT(*) AS count, MAX(created_at) AS most_recent_date
+                    FROM cam_feedback_history
+                    WHERE operation_type = :operation_type
+                      AND {material_predicate}
+                      AND geometry_type = :geometry_type
+                    GROUP BY user_choice
+                    ORDER BY count DESC, most_recent_date DESC
+                """,
+                "bindings": {
+                    "operation_type": operation_type,
+                    "material": material_binding,
+                    "geometry_type": geometry_key
+                },
+                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
+            }
+        }))
+
+        alternatives = []
+        if result and isinstance(result, dict):
+            rows = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
+            if rows:
+                for row in rows:
+                    # Handle both dict and list row formats
+                    if isinstance(row, dict):
+                        user_choice_str = row.get("user_choice")
+                        count = row.get("count", 0)
+                        most_recent_date = row.get("most_recent_date")
+                    elif isinstance(row, (list, tuple)) and len(row) >= 3:
+                        user_choice_str, count, most_recent_date = row[:3]
+                    else:
+                        continue
+
+                    try:
+                        choice = _json_loads(user_choice_str) if user_choice_str else None
+                    except (ValueError, TypeError):
+                        choice = None
+
+                    alternatives.append({
+                        "choice": choice,
+                        "count": count,
+                        "most_recent_date": most_recent_date,
+                        "weighted_score": count  # Simple count-based score
+                    })
+
+        # If only one distinct choice (or all None), no conflict
+        if len(alternatives) <= 1:
+            return []
+
+        return alternatives
+
+    except Exception:
+        # Never raise - return empty list on error
+        return []
+
+
+# =============================================================================
+# ACCEPTANCE RATE
+# =============================================================================
+
+def get_weighted_acceptance_rate_sql(
+    operation_type: str,
+    material: str,
+    geometry_type: str,
+    limit: int = 50,
+    halflife_days: float = 30.0,
+    mcp_call_func: Callable = None
+) -> Tuple[float, int, int]:
+    """
+    Weighted acceptance rate of matching feedback, aggregated inside SQLite.
+
+    Same result as get_weighted_acceptance_rate(get_matching_feedback(...)),
+    without transferring or parsing the rows: the decay weight
+    e^(-lambda * age_days) (clamped to 1.0, neutral 0.5 for unparseable
+    timestamps, 2x for explicit feedback) is summed by the query. Needs
+    SQLite's exp() (math functions, 3.35+); falls back to fetching just
+    created_at/feedback_type and weighting in Python if it's missing.
+
+    Args:
+        operation_type: Operation type to match exactly
+        material: Material name (matched like get_matching_feedback)
+        geometry_type: Geometry type to match exactly (normalized to lowercase)
+        limit: Most recent events to include (default: 50, as get_matching_feedback)
+        halflife_days: Number of days for weight to decay to 50% (default: 30.0)
+        mcp_call_func: MCP call function for SQLite operations
+
+    Returns:
+        Tuple of (acceptance_rate, sample_count, match_count):
+        - acceptance_rate, sample_count: as get_weighted_acceptance_rate(),
+          (0.5, 0) for no or negligible feedback
+        - match_count: Number of matching events (len of the history)
+        (0.5, 0, 0) on error
+    """
+    material_key = _normalize_key(material)
+    geometry_key = _normalize_key(geometry_type)
+    material_predicate, material_binding = _material_predicate(material_key)
+
+    try:
+        result = _unwrap_mcp_result(mcp_call_func("sqlite", {
+            "input": {
+                "database": CAM_FEEDBACK_DATABASE,
+                "sql": f"""
+                    SELECT COUNT(*) AS sample_count,
+                           SUM(weight) AS weighted_total,
+                           SUM(CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
+                                    THEN weight ELSE 0 END) AS weighted_accepts
+                    FROM (
+                        SELECT feedback_type,
+                               CASE WHEN created_at IS NULL OR created_at = '' THEN 0.0
+                                    ELSE COALESCE(
+                                        min(1.0, exp(-:decay_lambda
+                                            * (julianday('now') - julianday(created_at)))),
+                                        0.5)
+                               END
+                               * (CASE WHEN substr(feedback_type, 1, 9) = 'explicit_'
+                                       THEN 2.0 ELSE 1.0 END) AS weight
+                        FROM cam_feedback_history
+                        WHERE operation_type = :operation_type
+                          AND {material_predicate}
+                          AND geometry_type = :geometry_type
+                        ORDER BY created_at DESC
+                        LIMIT :limit
+                    )
+                """,
+                "bindings": {
+                    "operation_type": operation_type,
+                    "material": material_binding,
+                    "geometry_type": geometry_key,
+                    "limit": limit,
+                    "decay_lambda": _decay_lambda(halflife_days)
+                },
+                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
+            }
+        }))
+
+        if _sqlite_error(result) is not None:
+            # No exp() in this SQLite build: weight the two needed columns here
+            history = get_matching_feedback(
+                operation_type, material, geometry_type, limit=limit,
+                mcp_call_func=mcp_call_func, columns=("created_at", "feedback_type")
+            )
+            acceptance_rate, sample_count = get_weighted_acceptance_rate(history, halflife_days)
+            return (acceptance_rate, sample_count, len(history))
+
+        sample_count, weighted_total, weighted_accepts = 0, None, None
+        if result and isinstance(result, dict):
+            rows = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
+            if rows:
+                row = rows[0]
+                if isinstance(row, dict):
+                    sample_count = row.get("sample_count") or 0
+                    weighted_total = row.get("weighted_total")
+                    weighted_accepts = row.get("weighted_accepts")
+                elif isinstance(row, (list, tuple)) and len(row) >= 3:
+                    sample_count, weighted_total, weighted_accepts = row[:3]
+
+        # Neutral default for empty history or negligible weight
+        if not sample_count or weighted_total is None or weighted_total < 0.01:
+            return (0.5, 0, sample_count or 0)
+
+        acceptance_rate = (weighted_accepts or 0.0) / weighted_total
+        return (max(0.0, min(1.0, acceptance_rate)), sample_count, sample_count)
+
+    except Exception:
+        # Never raise - neutral default on error
+        return (0.5, 0, 0)
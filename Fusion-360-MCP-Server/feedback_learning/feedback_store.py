@@ -7,23 +7,46 @@ good/bad feedback. Uses MCP bridge for SQLite operations.
 
 Per CONTEXT.md:
 - Feedback events keyed by operation_type + material + geometry_type
+- Material family (e.g., "aluminum" for "6061 aluminum") stored per event
+  so matching is an indexed equality lookup
 - Context snapshots stored as JSON for future analysis
-- Immediate write-through (no batching) for simplicity
+- Immediate write-through by default; batch=True queues events and writes
+  them in one multi-row INSERT (flush_feedback, at 50 events, or at exit)
 - Per-category reset capability for targeted learning resets
 - Explicit feedback (good/bad) counts 2x weight compared to implicit accept/reject
 
 Functions:
     initialize_feedback_schema: Initialize SQLite table and indexes
     record_feedback: Store feedback event with full context
+    flush_feedback: Write queued (batch=True) feedback events
     get_feedback_statistics: Overall and per-category acceptance rates
     export_feedback_history: Export to CSV or JSON format
+    iter_feedback_history: Stream the export as string chunks
+    export_feedback_history_all: Per-operation-type exports from one query
     clear_feedback_history: Reset feedback data (all or by operation_type)
 """
 
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Iterator, List
+import atexit
+import copy
 import json
 import csv
+import functools
+import itertools
+import logging
+import threading
+import time
 from io import StringIO
+from operator import itemgetter
+
+# Optional fast JSON serializer for exports; falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 def _unwrap_mcp_result(result):
@@ -66,7 +89,8 @@ CREATE TABLE IF NOT EXISTS cam_feedback_history (
     feedback_type TEXT NOT NULL,
     feedback_note TEXT,
     confidence_before REAL,
-    created_at TIMESTAMP DEFAULT (datetime('now'))
+    created_at TIMESTAMP DEFAULT (datetime('now')),
+    material_family TEXT
 );
 """
 
@@ -75,9 +99,16 @@ CREATE INDEX IF NOT EXISTS idx_feedback_material_geometry
 ON cam_feedback_history(material, geometry_type);
 """
 
-INDEX_OPERATION_TYPE = """
-CREATE INDEX IF NOT EXISTS idx_feedback_operation_type
-ON cam_feedback_history(operation_type);
+# Serves the filtered export (WHERE operation_type ORDER BY created_at DESC)
+# without a sort, and every other operation_type filter via its prefix
+INDEX_OPERATION_CREATED_AT = """
+CREATE INDEX IF NOT EXISTS idx_feedback_op_created
+ON cam_feedback_history(operation_type, created_at DESC);
+"""
+
+# Superseded by idx_feedback_op_created (same leading column)
+DROP_INDEX_OPERATION_TYPE = """
+DROP INDEX IF EXISTS idx_feedback_operation_type;
 """
 
 INDEX_CREATED_AT = """
@@ -85,22 +116,352 @@ CREATE INDEX IF NOT EXISTS idx_feedback_created_at
 ON cam_feedback_history(created_at DESC);
 """
 
+# Seeks get_matching_feedback's predicate in ORDER BY order (no scan, no sort)
+# and carries the small columns confidence scoring and conflict grouping read,
+# so those queries never touch the table. The large JSON snapshots stay out.
+INDEX_MATCH_COVERING = """
+CREATE INDEX IF NOT EXISTS idx_feedback_match_covering
+ON cam_feedback_history(operation_type, material_family, geometry_type, created_at DESC,
+                        feedback_type, user_choice);
+"""
+
+# Superseded by idx_feedback_match_covering (same key prefix)
+DROP_INDEX_FAMILY_GEOMETRY_OPERATION = """
+DROP INDEX IF EXISTS idx_feedback_family_geom_op;
+"""
+
+# SQLite tuning applied at schema init (module-level so they can be overridden
+# before initialize_feedback_schema runs). journal_mode=WAL is persistent in
+# the database file; the others apply to the connection they're issued on.
+SQLITE_JOURNAL_MODE = "WAL"
+SQLITE_SYNCHRONOUS = "NORMAL"  # Safe under WAL, avoids an fsync per commit
+SQLITE_MMAP_SIZE = 268435456  # 256 MB
+SQLITE_TEMP_STORE = "MEMORY"  # GROUP BY / ORDER BY temp tables off disk
+SQLITE_CACHE_SIZE = -20000  # Negative = KiB, so ~20 MB page cache
+
+# Table plus the indexes that don't depend on material_family, sent after the
+# pragmas (as one script when the MCP sqlite tool runs multi-statement SQL).
+# The family index is created by the migration once the column is known to
+# exist.
+SCHEMA_STATEMENTS = (
+    FEEDBACK_HISTORY_SCHEMA,
+    INDEX_MATERIAL_GEOMETRY,
+    DROP_INDEX_OPERATION_TYPE,
+    INDEX_OPERATION_CREATED_AT,
+    INDEX_CREATED_AT,
+)
+
+# Material name keywords -> material family, checked in order (so
+# "stainless" wins over "steel"). Materials with no keyword are their own
+# family.
+MATERIAL_FAMILY_KEYWORDS = (
+    ("aluminum", "aluminum"),
+    ("aluminium", "aluminum"),
+    ("6061", "aluminum"),
+    ("7075", "aluminum"),
+    ("5052", "aluminum"),
+    ("2024", "aluminum"),
+    ("stainless", "stainless steel"),
+    ("304", "stainless steel"),
+    ("316", "stainless steel"),
+    ("steel", "steel"),
+    ("1018", "steel"),
+    ("1045", "steel"),
+    ("4140", "steel"),
+    ("brass", "brass"),
+    ("bronze", "bronze"),
+    ("copper", "copper"),
+    ("titanium", "titanium"),
+    ("delrin", "plastic"),
+    ("acetal", "plastic"),
+    ("hdpe", "plastic"),
+    ("nylon", "plastic"),
+    ("acrylic", "plastic"),
+    ("plastic", "plastic"),
+    ("wood", "wood"),
+)
+
 # MCP bridge SQLite tool unlock token (from sqlite MCP server docs)
 SQLITE_TOOL_UNLOCK_TOKEN = "8d8f7853"
 
+# Columns broken down by get_feedback_statistics (one GROUP BY each)
+_STATISTICS_GROUP_COLUMNS = ("material", "geometry_type", "operation_type")
+
+# get_feedback_statistics results keyed by operation_type filter:
+# {operation_type: (expires_at, stats)}. Cleared whenever this module writes
+# feedback; the TTL bounds staleness from writes made by other sessions.
+# Callers always get a deep copy, so editing a result can't alter the cache.
+_STATS_CACHE_TTL_SECONDS = 60.0
+_stats_cache = {}
+
+# Columns written by record_feedback, in INSERT order (each bound by name)
+_FEEDBACK_INSERT_COLUMNS = (
+    "operation_type", "material", "geometry_type", "context_snapshot",
+    "suggestion_payload", "user_choice", "feedback_type", "feedback_note",
+    "confidence_before", "material_family",
+)
+
+# Columns written by export_feedback_history, in SELECT (row position) order
+_EXPORT_FIELDNAMES = (
+    "id", "operation_type", "material", "geometry_type",
+    "context_snapshot", "suggestion_payload", "user_choice",
+    "feedback_type", "feedback_note", "confidence_before", "created_at",
+)
+
+# Fixed SQL text for export/clear, one constant per variant, so each call
+# sends identical text the statement cache can reuse
+_EXPORT_SQL_ALL = (
+    f"SELECT {', '.join(_EXPORT_FIELDNAMES)} FROM cam_feedback_history "
+    "ORDER BY created_at DESC"
+)
+_EXPORT_SQL_FILTERED = (
+    f"SELECT {', '.join(_EXPORT_FIELDNAMES)} FROM cam_feedback_history "
+    "WHERE operation_type = :operation_type ORDER BY created_at DESC"
+)
+_EXPORT_SQL_BY_OPERATION = (
+    f"SELECT {', '.join(_EXPORT_FIELDNAMES)} FROM cam_feedback_history "
+    "ORDER BY operation_type, created_at DESC"
+)
+
+# RETURNING (SQLite 3.35+) reports the deleted ids in the same round trip
+_DELETE_SQL_ALL = "DELETE FROM cam_feedback_history RETURNING id"
+_DELETE_SQL_FILTERED = (
+    "DELETE FROM cam_feedback_history WHERE operation_type = :operation_type RETURNING id"
+)
+
+# Used until DELETE ... RETURNING has been seen to return rows: count the
+# matching rows first, then delete without RETURNING
+_COUNT_SQL_ALL = "SELECT COUNT(*) AS row_count FROM cam_feedback_history"
+_COUNT_SQL_FILTERED = (
+    "SELECT COUNT(*) AS row_count FROM cam_feedback_history WHERE operation_type = :operation_type"
+)
+_DELETE_SQL_ALL_PLAIN = "DELETE FROM cam_feedback_history"
+_DELETE_SQL_FILTERED_PLAIN = "DELETE FROM cam_feedback_history WHERE operation_type = :operation_type"
+
+# Whether DELETE ... RETURNING comes back with one row per deleted event:
+# None until a clear with matching rows finds out (True only once a
+# non-empty row list came back), then reused for the session
+_delete_returns_rows = None
+
+# Write-behind queue for record_feedback(batch=True): binding dicts waiting
+# to be inserted, and the MCP call function used for the exit-time flush.
+# 50 rows x 10 columns stays well under SQLite's bound-parameter limit.
+_PENDING_FLUSH_SIZE = 50
+_pending_feedback = []
+_pending_feedback_lock = threading.Lock()
+_pending_mcp_call_func = None
+
 # Persistent database file for CAM feedback (uses @user_data prefix resolved by MCP sqlite tool)
 CAM_FEEDBACK_DATABASE = "@user_data/cam_feedback.db"
 
 
+# =============================================================================
+# MATERIAL FAMILY
+# =============================================================================
+
+@functools.lru_cache(maxsize=256)
+def _normalize_key(text: str) -> str:
+    """Lowercase and strip a material/geometry name (cached; names repeat)."""
+    return text.lower().strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _material_family(material_key: str) -> Optional[str]:
+    """
+    Get the material family for a normalized (lowercase) material name.
+
+    Returns:
+        Family name (e.g., "aluminum" for "6061 aluminum"), or None if no
+        family keyword appears in the name
+    """
+    for keyword, family in MATERIAL_FAMILY_KEYWORDS:
+        if keyword in material_key:
+            return family
+    return None
+
+
+def _material_family_sql() -> str:
+    """Build the SQL CASE expression equivalent of _material_family() for backfills."""
+    whens = " ".join(
+        f"WHEN instr(material, '{keyword}') > 0 THEN '{family}'"
+        for keyword, family in MATERIAL_FAMILY_KEYWORDS
+    )
+    return f"CASE {whens} ELSE material END"
+
+
+# Set once the material_family column has been added and backfilled in this session
+_material_family_migrated = False
+
+
+def _migrate_material_family(mcp_call_func: Callable) -> bool:
+    """
+    Add and backfill the material_family column on databases created before it existed.
+
+    Runs once per session. Rows recorded without a family get it derived
+    from their material name, and the covering family index is created.
+    Only marked done once every step has succeeded, so a failed migration
+    is retried by the next initialize_feedback_schema call.
+
+    Returns:
+        True on success, False on error
+    """
+    global _material_family_migrated
+    if _material_family_migrated:
+        return True
+
+    column_result = _run_schema_sql(mcp_call_func, """
+        SELECT COUNT(*) AS column_count
+        FROM pragma_table_info('cam_feedback_history')
+        WHERE name = 'material_family'
+    """)
+    if not _check_write_result(column_result):
+        return False
+    has_column = bool(_first_count(column_result))
+
+    # ALTER is not idempotent, so it always goes in its own call (once per
+    # database); the rest can be re-sent safely if a script runs partially
+    if not has_column:
+        if not _check_write_result(_run_schema_sql(
+            mcp_call_func, "ALTER TABLE cam_feedback_history ADD COLUMN material_family TEXT;"
+        )):
+            return False
+
+    statements = (
+        f"UPDATE cam_feedback_history SET material_family = {_material_family_sql()} "
+        "WHERE material_family IS NULL;",
+        DROP_INDEX_FAMILY_GEOMETRY_OPERATION,
+        INDEX_MATCH_COVERING,
+    )
+    if not _run_schema_statements(mcp_call_func, statements):
+        return False
+
+    _material_family_migrated = True
+    return True
+
+
 # =============================================================================
 # SCHEMA INITIALIZATION
 # =============================================================================
 
+# Whether the MCP sqlite tool runs every statement of a multi-statement
+# script: None until a schema script has been checked, then reused for the
+# session. When False, schema statements are sent one per call.
+_multi_statement_supported = None
+
+# Table created by the last statement of a script while multi-statement
+# support is unverified. It is dropped before the script runs, so finding
+# it afterwards proves every statement ran (the schema's own tables and
+# indexes may already exist from an earlier session).
+_SCRIPT_PROBE_TABLE = "cam_feedback_script_probe"
+
+
+def _schema_pragmas() -> List[str]:
+    """Build the PRAGMA statements for the current SQLITE_* settings."""
+    return [
+        f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE};",
+        f"PRAGMA synchronous={SQLITE_SYNCHRONOUS};",
+        f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)};",
+        f"PRAGMA temp_store={SQLITE_TEMP_STORE};",
+        f"PRAGMA cache_size={int(SQLITE_CACHE_SIZE)};",
+    ]
+
+
+def _run_schema_sql(mcp_call_func: Callable, sql: str, bindings: Dict[str, Any] = None):
+    """Send one schema/maintenance SQL call and return the unwrapped result."""
+    return _unwrap_mcp_result(mcp_call_func("sqlite", {
+        "input": {
+            "database": CAM_FEEDBACK_DATABASE,
+            "sql": sql,
+            "bindings": bindings or {},
+            "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
+        }
+    }))
+
+
+def _first_count(result) -> int:
+    """Read the single COUNT(*) value from a query result (dict or list rows)."""
+    if not isinstance(result, dict):
+        return 0
+    rows = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
+    if not rows or not isinstance(rows, list):
+        return 0
+    row = rows[0]
+    if isinstance(row, dict):
+        value = next(iter(row.values()), 0)
+    elif isinstance(row, (list, tuple)) and len(row) >= 1:
+        value = row[0]
+    else:
+        return 0
+    return value if isinstance(value, int) else 0
+
+
+def _table_exists(mcp_call_func: Callable, table_name: str) -> bool:
+    """Check whether a table exists in the feedback database."""
+    result = _run_schema_sql(
+        mcp_call_func,
+        "SELECT COUNT(*) AS table_count FROM sqlite_master "
+        "WHERE type = 'table' AND name = :table_name",
+        {"table_name": table_name}
+    )
+    return _first_count(result) > 0
+
+
+def _run_schema_statements(mcp_call_func: Callable, statements) -> bool:
+    """
+    Run idempotent schema statements, as one script when the bridge allows it.
+
+    Until the bridge is verified, the script ends by creating the probe
+    table (_SCRIPT_PROBE_TABLE) dropped just before, and only counts as
+    applied if the write succeeded and the probe exists, since a bridge
+    that executes just the first statement still reports success. Otherwise
+    every statement is sent again in its own call. PRAGMA failures are
+    tolerated there: the tuning pragmas are best-effort.
+
+    Returns:
+        True if every non-PRAGMA statement succeeded, False otherwise
+    """
+    global _multi_statement_supported
+
+    if _multi_statement_supported is not False:
+        script = list(statements)
+        error = None
+        if not _multi_statement_supported:
+            error = _sqlite_error(_run_schema_sql(
+                mcp_call_func, f"DROP TABLE IF EXISTS {_SCRIPT_PROBE_TABLE};"
+            ))
+            script.append(f"CREATE TABLE IF NOT EXISTS {_SCRIPT_PROBE_TABLE} (id INTEGER);")
+
+        if error is None:
+            error = _sqlite_error(_run_schema_sql(mcp_call_func, "\n".join(script)))
+        if error is None:
+            if _multi_statement_supported:
+                return True
+            if _table_exists(mcp_call_func, _SCRIPT_PROBE_TABLE):
+                _run_schema_sql(mcp_call_func, f"DROP TABLE IF EXISTS {_SCRIPT_PROBE_TABLE};")
+                _multi_statement_supported = True
+                return True
+            error = "only part of the script ran"
+        # A verified bridge keeps scripts on (the failure may be transient);
+        # an unverified one that rejects or truncates them is switched off
+        logger.warning("Multi-statement schema script failed (%s); sending statements one per call", error)
+        if _multi_statement_supported is None:
+            _multi_statement_supported = False
+
+    for statement in statements:
+        result = _run_schema_sql(mcp_call_func, statement)
+        if not _check_write_result(result) and not statement.lstrip().upper().startswith("PRAGMA"):
+            return False
+    return True
+
+
 def initialize_feedback_schema(mcp_call_func: Callable) -> bool:
     """
     Initialize the SQLite schema for CAM feedback history.
 
-    Creates table and indexes if they don't exist. Safe to call multiple times.
+    Creates table and indexes if they don't exist and applies the SQLITE_*
+    pragmas (WAL journal, mmap, in-memory temp store, page cache). These go
+    as one script when the MCP sqlite tool runs multi-statement SQL, and
+    one statement per call otherwise. Safe to call multiple times.
 
     Args:
         mcp_call_func: MCP call function (e.g., mcp.call)
@@ -114,50 +475,14 @@ def initialize_feedback_schema(mcp_call_func: Callable) -> bool:
         >>> success = initialize_feedback_schema(mcp_call)
     """
     try:
-        # Create table
-        result1 = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": FEEDBACK_HISTORY_SCHEMA,
-                "bindings": {},
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
-
-        # Create indexes
-        result2 = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": INDEX_MATERIAL_GEOMETRY,
-                "bindings": {},
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
-
-        result3 = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": INDEX_OPERATION_TYPE,
-                "bindings": {},
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
-
-        result4 = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": INDEX_CREATED_AT,
-                "bindings": {},
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
+        # Pragmas, table and base indexes (single call when supported)
+        statements = _schema_pragmas() + list(SCHEMA_STATEMENTS)
+        if not _run_schema_statements(mcp_call_func, statements):
+            return False
 
-        # Check for errors in results
-        for result in [result1, result2, result3, result4]:
-            if result and isinstance(result, dict) and result.get("error"):
-                return False
-
-        return True
+        # Databases from earlier versions lack material_family; also
+        # creates the family index
+        return _migrate_material_family(mcp_call_func)
 
     except Exception as e:
         # Re-raise to see what's failing
@@ -168,6 +493,75 @@ def initialize_feedback_schema(mcp_call_func: Callable) -> bool:
 # FEEDBACK RECORDING
 # =============================================================================
 
+def _feedback_bindings(
+    operation_type: str,
+    material: str,
+    geometry_type: str,
+    context: Dict[str, Any],
+    suggestion: Dict[str, Any],
+    user_choice: Optional[Dict[str, Any]],
+    feedback_type: str,
+    note: Optional[str]
+) -> Dict[str, Any]:
+    """Normalize a feedback event into INSERT bindings keyed by column name."""
+    # Normalize material and geometry_type to lowercase
+    material_key = _normalize_key(material)
+    geometry_key = _normalize_key(geometry_type)
+
+    return {
+        "operation_type": operation_type,
+        "material": material_key,
+        "material_family": _material_family(material_key) or material_key,
+        "geometry_type": geometry_key,
+        # Serialize dicts to compact JSON. Only user_choice is canonicalized
+        # (sorted keys): it is grouped on, the others are opaque blobs.
+        "context_snapshot": json.dumps(context, separators=(",", ":")),
+        "suggestion_payload": json.dumps(suggestion, separators=(",", ":")),
+        "user_choice": json.dumps(user_choice, sort_keys=True) if user_choice else None,
+        "feedback_type": feedback_type,
+        "feedback_note": note,
+        # Extract confidence_before from suggestion
+        "confidence_before": suggestion.get("confidence_score")
+    }
+
+
+def _sqlite_error(result) -> Optional[str]:
+    """
+    Get the failure reported by an unwrapped MCP sqlite response.
+
+    Returns:
+        Error description, or None if the call succeeded
+    """
+    # Unwrap double-nested result (MCP response has result.result structure)
+    if isinstance(result, dict) and 'result' in result:
+        result = result['result']
+
+    # Check for errors - check actual MCP sqlite tool response structure
+    if not result:
+        return "Empty result"
+    if isinstance(result, dict):
+        # Check for isError flag (MCP sqlite tool sets this)
+        if result.get("isError") == True:
+            return f"Tool error: {result.get('error_message_if_operation_failed')}"
+        # Check operation_was_successful flag
+        if result.get("operation_was_successful") == False:
+            return f"Operation failed: {result.get('error_message_if_operation_failed')}"
+        # Check for error field
+        if result.get("error"):
+            return f"Database error: {result.get('error')}"
+
+    return None
+
+
+def _check_write_result(result) -> bool:
+    """Check an unwrapped MCP sqlite write response, logging any failure."""
+    error = _sqlite_error(result)
+    if error is not None:
+        logger.error("SQLite call failed: %s", error)
+        return False
+    return True
+
+
 def record_feedback(
     operation_type: str,
     material: str,
@@ -177,7 +571,8 @@ def record_feedback(
     user_choice: Optional[Dict[str, Any]],
     feedback_type: str,
     note: Optional[str],
-    mcp_call_func: Callable
+    mcp_call_func: Callable,
+    batch: bool = False
 ) -> bool:
     """
     Record a feedback event to SQLite.
@@ -192,9 +587,12 @@ def record_feedback(
         feedback_type: 'implicit_accept', 'implicit_reject', 'explicit_good', 'explicit_bad'
         note: Optional text explanation from user
         mcp_call_func: MCP call function for SQLite operations
+        batch: Queue the event instead of writing it now. Queued events are
+               written by flush_feedback(), once 50 are pending, or at exit,
+               and aren't visible to queries until then.
 
     Returns:
-        True on success, False on error
+        True on success (or when queued), False on error
 
     Example:
         >>> record_feedback(
@@ -209,74 +607,141 @@ def record_feedback(
         ...     mcp_call
         ... )
     """
-    # Normalize material and geometry_type to lowercase
-    material_key = material.lower().strip()
-    geometry_key = geometry_type.lower().strip()
+    global _pending_mcp_call_func
 
     try:
-        # Serialize dicts to JSON
-        context_json = json.dumps(context, sort_keys=True)
-        suggestion_json = json.dumps(suggestion, sort_keys=True)
-        user_choice_json = json.dumps(user_choice, sort_keys=True) if user_choice else None
-
-        # Extract confidence_before from suggestion
-        confidence_before = suggestion.get("confidence_score")
+        bindings = _feedback_bindings(
+            operation_type, material, geometry_type, context, suggestion,
+            user_choice, feedback_type, note
+        )
+
+        if batch:
+            with _pending_feedback_lock:
+                _pending_feedback.append(bindings)
+                _pending_mcp_call_func = mcp_call_func
+                pending_count = len(_pending_feedback)
+            if pending_count >= _PENDING_FLUSH_SIZE:
+                return flush_feedback(mcp_call_func)
+            return True
+
+        columns = ", ".join(_FEEDBACK_INSERT_COLUMNS)
+        placeholders = ", ".join(f":{column}" for column in _FEEDBACK_INSERT_COLUMNS)
 
         # Insert feedback record
         result = _unwrap_mcp_result(mcp_call_func("sqlite", {
             "input": {
                 "database": CAM_FEEDBACK_DATABASE,
-                "sql": """
-                    INSERT INTO cam_feedback_history
-                    (operation_type, material, geometry_type, context_snapshot,
-                     suggestion_payload, user_choice, feedback_type, feedback_note,
-                     confidence_before)
-                    VALUES (:operation_type, :material, :geometry_type, :context_snapshot,
-                            :suggestion_payload, :user_choice, :feedback_type, :feedback_note,
-                            :confidence_before)
+                "sql": f"""
+                    INSERT INTO cam_feedback_history ({columns})
+                    VALUES ({placeholders})
                 """,
-                "bindings": {
-                    "operation_type": operation_type,
-                    "material": material_key,
-                    "geometry_type": geometry_key,
-                    "context_snapshot": context_json,
-                    "suggestion_payload": suggestion_json,
-                    "user_choice": user_choice_json,
-                    "feedback_type": feedback_type,
-                    "feedback_note": note,
-                    "confidence_before": confidence_before
-                },
+                "bindings": bindings,
                 "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
             }
         }))
 
-        # Unwrap double-nested result (MCP response has result.result structure)
-        if isinstance(result, dict) and 'result' in result:
-            result = result['result']
+        # New feedback changes every statistic
+        _stats_cache.clear()
+
+        return _check_write_result(result)
+
+    except Exception as e:
+        # Re-raise to see what's failing
+        raise
+
+
+def flush_feedback(mcp_call_func: Callable = None) -> bool:
+    """
+    Write feedback events queued by record_feedback(batch=True).
+
+    Pending events go in multi-row INSERTs of up to 50 rows. Events that
+    could not be written (failed write, exception, or no call function) are
+    put back at the front of the queue for the next flush. Safe to call
+    with nothing queued.
 
-        # Check for errors - check actual MCP sqlite tool response structure
-        if not result:
-            print("[FEEDBACK_STORE ERROR] Failed to record feedback - empty result")
+    Args:
+        mcp_call_func: MCP call function for SQLite operations
+                       (defaults to the one the events were queued with)
+
+    Returns:
+        True on success or if nothing was queued, False on error
+    """
+    with _pending_feedback_lock:
+        pending = _pending_feedback[:]
+        del _pending_feedback[:]
+        call_func = mcp_call_func or _pending_mcp_call_func
+
+    if not pending:
+        return True
+
+    written = 0
+    try:
+        if call_func is None:
+            logger.error("Cannot flush %d queued feedback events - no MCP call function", len(pending))
             return False
-        if isinstance(result, dict):
-            # Check for isError flag (MCP sqlite tool sets this)
-            if result.get("isError") == True:
-                print(f"[FEEDBACK_STORE ERROR] Failed to record: {result.get('error_message_if_operation_failed')}")
-                return False
-            # Check operation_was_successful flag
-            if result.get("operation_was_successful") == False:
-                print(f"[FEEDBACK_STORE ERROR] Operation failed: {result.get('error_message_if_operation_failed')}")
-                return False
-            # Check for error field
-            if result.get("error"):
-                print(f"[FEEDBACK_STORE ERROR] Database error: {result.get('error')}")
+
+        while written < len(pending):
+            batch = pending[written:written + _PENDING_FLUSH_SIZE]
+
+            # Per-row named bindings (:operation_type_0, :material_0, ...)
+            bindings = {}
+            rows = []
+            for index, event in enumerate(batch):
+                placeholders = []
+                for column in _FEEDBACK_INSERT_COLUMNS:
+                    name = f"{column}_{index}"
+                    bindings[name] = event[column]
+                    placeholders.append(f":{name}")
+                rows.append(f"({', '.join(placeholders)})")
+
+            result = _unwrap_mcp_result(call_func("sqlite", {
+                "input": {
+                    "database": CAM_FEEDBACK_DATABASE,
+                    "sql": f"""
+                        INSERT INTO cam_feedback_history ({", ".join(_FEEDBACK_INSERT_COLUMNS)})
+                        VALUES {", ".join(rows)}
+                    """,
+                    "bindings": bindings,
+                    "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
+                }
+            }))
+
+            # New feedback changes every statistic
+            _stats_cache.clear()
+
+            if not _check_write_result(result):
                 return False
+            written += len(batch)
 
         return True
 
-    except Exception as e:
-        # Re-raise to see what's failing
-        raise
+    finally:
+        # Requeue whatever wasn't written, ahead of events queued meanwhile
+        if written < len(pending):
+            with _pending_feedback_lock:
+                _pending_feedback[:0] = pending[written:]
+
+
+def _flush_feedback_at_exit():
+    """
+    Write any still-queued feedback when the interpreter exits.
+
+    The MCP bridge may already be shut down at this point, so failures are
+    only logged.
+    """
+    with _pending_feedback_lock:
+        pending_count = len(_pending_feedback)
+    if not pending_count:
+        return
+    try:
+        if not flush_feedback():
+            logger.warning("Dropped %d queued feedback events at exit", pending_count)
+    except Exception:
+        logger.warning("Dropped %d queued feedback events at exit - MCP bridge unavailable",
+                       pending_count, exc_info=True)
+
+
+atexit.register(_flush_feedback_at_exit)
 
 
 # =============================================================================
@@ -305,6 +770,10 @@ def get_feedback_statistics(
         >>> stats = get_feedback_statistics(mcp_call_func=mcp_call)
         >>> print(f"Overall acceptance: {stats['overall']['acceptance_rate']:.1%}")
     """
+    cached = _stats_cache.get(operation_type)
+    if cached and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
     try:
         # Build WHERE clause if filtering by operation_type
         where_clause = ""
@@ -313,54 +782,32 @@ def get_feedback_statistics(
             where_clause = "WHERE operation_type = :operation_type"
             bindings = {"operation_type": operation_type}
 
-        # Overall statistics
-        overall_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
+        # One query for all groupings (emulated GROUPING SETS): one MCP round
+        # trip and one pass over the filtered rows instead of one per breakdown
+        group_selects = [
+            "SELECT 'overall' AS grp, NULL AS grp_key, COUNT(*) AS count, "
+            "SUM(ok) AS accept_count, NULL AS acceptance_pct FROM base"
+        ]
+        for column in _STATISTICS_GROUP_COLUMNS:
+            if column == "operation_type" and operation_type:
+                continue  # Already filtered to a single operation type
+            group_selects.append(
+                f"SELECT '{column}', {column}, COUNT(*), SUM(ok), "
+                f"ROUND(100.0 * SUM(ok) / COUNT(*), 1) FROM base GROUP BY {column}"
+            )
+
+        stats_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
             "input": {
                 "database": CAM_FEEDBACK_DATABASE,
                 "sql": f"""
-                    SELECT
-                        COUNT(*) as total_count,
-                        SUM(CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
-                            THEN 1 ELSE 0 END) as accept_count
-                    FROM cam_feedback_history
-                    {where_clause}
-                """,
-                "bindings": bindings,
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
-
-        overall = {"total_count": 0, "accept_count": 0, "acceptance_rate": 0.0}
-        if overall_result and isinstance(overall_result, dict):
-            rows = overall_result.get("data_rows_from_result_set") or overall_result.get("rows") or overall_result.get("data") or overall_result.get("result")
-            if rows and len(rows) > 0:
-                row = rows[0]
-                if isinstance(row, dict):
-                    total = row.get("total_count", 0)
-                    accepts = row.get("accept_count", 0)
-                elif isinstance(row, (list, tuple)) and len(row) >= 2:
-                    total = row[0] if row[0] is not None else 0
-                    accepts = row[1] if row[1] is not None else 0
-                else:
-                    total = accepts = 0
-
-                overall["total_count"] = total
-                overall["accept_count"] = accepts
-                overall["acceptance_rate"] = accepts / total if total > 0 else 0.0
-
-        # By material breakdown
-        material_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": f"""
-                    SELECT
-                        material,
-                        COUNT(*) as count,
-                        ROUND(100.0 * SUM(CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
-                            THEN 1 ELSE 0 END) / COUNT(*), 1) as acceptance_pct
-                    FROM cam_feedback_history
-                    {where_clause}
-                    GROUP BY material
+                    WITH base AS (
+                        SELECT material, geometry_type, operation_type,
+                               CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
+                                   THEN 1 ELSE 0 END AS ok
+                        FROM cam_feedback_history
+                        {where_clause}
+                    )
+                    {" UNION ALL ".join(group_selects)}
                     ORDER BY count DESC
                 """,
                 "bindings": bindings,
@@ -368,111 +815,56 @@ def get_feedback_statistics(
             }
         }))
 
-        by_material = []
-        if material_result and isinstance(material_result, dict):
-            rows = material_result.get("data_rows_from_result_set") or material_result.get("rows") or material_result.get("data") or material_result.get("result")
-            if rows:
-                for row in rows:
-                    if isinstance(row, dict):
-                        by_material.append({
-                            "material": row.get("material"),
-                            "count": row.get("count", 0),
-                            "acceptance_pct": row.get("acceptance_pct", 0.0)
-                        })
-                    elif isinstance(row, (list, tuple)) and len(row) >= 3:
-                        by_material.append({
-                            "material": row[0],
-                            "count": row[1] if row[1] is not None else 0,
-                            "acceptance_pct": row[2] if row[2] is not None else 0.0
-                        })
-
-        # By geometry_type breakdown
-        geometry_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": f"""
-                    SELECT
-                        geometry_type,
-                        COUNT(*) as count,
-                        ROUND(100.0 * SUM(CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
-                            THEN 1 ELSE 0 END) / COUNT(*), 1) as acceptance_pct
-                    FROM cam_feedback_history
-                    {where_clause}
-                    GROUP BY geometry_type
-                    ORDER BY count DESC
-                """,
-                "bindings": bindings,
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
+        overall = {"total_count": 0, "accept_count": 0, "acceptance_rate": 0.0}
+        breakdowns = {column: [] for column in _STATISTICS_GROUP_COLUMNS}
 
-        by_geometry_type = []
-        if geometry_result and isinstance(geometry_result, dict):
-            rows = geometry_result.get("data_rows_from_result_set") or geometry_result.get("rows") or geometry_result.get("data") or geometry_result.get("result")
+        if stats_result and isinstance(stats_result, dict):
+            rows = stats_result.get("data_rows_from_result_set") or stats_result.get("rows") or stats_result.get("data") or stats_result.get("result")
             if rows:
                 for row in rows:
+                    # Handle both dict and list row formats
                     if isinstance(row, dict):
-                        by_geometry_type.append({
-                            "geometry_type": row.get("geometry_type"),
-                            "count": row.get("count", 0),
-                            "acceptance_pct": row.get("acceptance_pct", 0.0)
-                        })
-                    elif isinstance(row, (list, tuple)) and len(row) >= 3:
-                        by_geometry_type.append({
-                            "geometry_type": row[0],
-                            "count": row[1] if row[1] is not None else 0,
-                            "acceptance_pct": row[2] if row[2] is not None else 0.0
+                        grp = row.get("grp")
+                        key = row.get("grp_key")
+                        count = row.get("count")
+                        accepts = row.get("accept_count")
+                        acceptance_pct = row.get("acceptance_pct")
+                    elif isinstance(row, (list, tuple)) and len(row) >= 5:
+                        grp, key, count, accepts, acceptance_pct = row[:5]
+                    else:
+                        continue
+
+                    count = count if count is not None else 0
+                    if grp == "overall":
+                        accepts = accepts if accepts is not None else 0
+                        overall["total_count"] = count
+                        overall["accept_count"] = accepts
+                        overall["acceptance_rate"] = accepts / count if count > 0 else 0.0
+                    elif grp in breakdowns:
+                        breakdowns[grp].append({
+                            grp: key,
+                            "count": count,
+                            "acceptance_pct": acceptance_pct if acceptance_pct is not None else 0.0
                         })
 
-        # By operation_type breakdown (unless already filtered)
-        by_operation_type = []
-        if not operation_type:
-            operation_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
-                "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": """
-                        SELECT
-                            operation_type,
-                            COUNT(*) as count,
-                            ROUND(100.0 * SUM(CASE WHEN feedback_type IN ('implicit_accept', 'explicit_good')
-                                THEN 1 ELSE 0 END) / COUNT(*), 1) as acceptance_pct
-                        FROM cam_feedback_history
-                        GROUP BY operation_type
-                        ORDER BY count DESC
-                    """,
-                    "bindings": {},
-                    "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-                }
-            }))
-
-            if operation_result and isinstance(operation_result, dict):
-                rows = operation_result.get("data_rows_from_result_set") or operation_result.get("rows") or operation_result.get("data") or operation_result.get("result")
-                if rows:
-                    for row in rows:
-                        if isinstance(row, dict):
-                            by_operation_type.append({
-                                "operation_type": row.get("operation_type"),
-                                "count": row.get("count", 0),
-                                "acceptance_pct": row.get("acceptance_pct", 0.0)
-                            })
-                        elif isinstance(row, (list, tuple)) and len(row) >= 3:
-                            by_operation_type.append({
-                                "operation_type": row[0],
-                                "count": row[1] if row[1] is not None else 0,
-                                "acceptance_pct": row[2] if row[2] is not None else 0.0
-                            })
-
-        return {
+        stats = {
             "overall": overall,
-            "by_material": by_material,
-            "by_geometry_type": by_geometry_type,
-            "by_operation_type": by_operation_type
+            "by_material": breakdowns["material"],
+            "by_geometry_type": breakdowns["geometry_type"],
+            "by_operation_type": breakdowns["operation_type"]
         }
 
-    except Exception as e:
-        import traceback
-        print(f"[FEEDBACK_STATS ERROR] Exception caught: {str(e)}")
-        print(f"[FEEDBACK_STATS ERROR] Traceback: {traceback.format_exc()}")
+        # Only cache answers the database actually gave
+        if isinstance(stats_result, dict) and not stats_result.get("error"):
+            _stats_cache[operation_type] = (
+                time.monotonic() + _STATS_CACHE_TTL_SECONDS, copy.deepcopy(stats)
+            )
+
+        return stats
+
+    except Exception:
+        # Traceback formatting only happens when DEBUG logging is enabled
+        logger.debug("Feedback statistics query failed", exc_info=True)
         return {
             "overall": {"total_count": 0, "accept_count": 0, "acceptance_rate": 0.0},
             "by_material": [],
@@ -485,6 +877,13 @@ def get_feedback_statistics(
 # FEEDBACK EXPORT
 # =============================================================================
 
+def _dumps_indented(data: Any) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def export_feedback_history(
     format: str,
     operation_type: Optional[str] = None,
@@ -507,82 +906,182 @@ def export_feedback_history(
         ...     f.write(csv_data)
     """
     try:
-        # Build WHERE clause if filtering by operation_type
-        where_clause = ""
-        bindings = {}
+        return "".join(iter_feedback_history(format, operation_type, mcp_call_func))
+    except Exception:
+        return ""
+
+
+def iter_feedback_history(
+    format: str,
+    operation_type: Optional[str] = None,
+    mcp_call_func: Callable = None
+) -> Iterator[str]:
+    """
+    Stream feedback history as CSV or JSON text chunks.
+
+    Yields the same text export_feedback_history() returns, one row at a
+    time, so callers can write it to a file or response without building
+    the whole export string.
+
+    Args:
+        format: 'csv' or 'json'
+        operation_type: Optional filter by operation type
+        mcp_call_func: MCP call function for SQLite operations
+
+    Yields:
+        Consecutive pieces of the formatted export. Yields nothing on error
+        or for unknown formats.
+
+    Example:
+        >>> with open('feedback.csv', 'w') as f:
+        ...     f.writelines(iter_feedback_history('csv', mcp_call_func=mcp_call))
+    """
+    if format not in ('csv', 'json'):
+        return
+
+    try:
+        # Filter by operation_type if given
         if operation_type:
-            where_clause = "WHERE operation_type = :operation_type"
+            sql = _EXPORT_SQL_FILTERED
             bindings = {"operation_type": operation_type}
+        else:
+            sql = _EXPORT_SQL_ALL
+            bindings = {}
 
         # Query all feedback rows
         result = _unwrap_mcp_result(mcp_call_func("sqlite", {
             "input": {
                 "database": CAM_FEEDBACK_DATABASE,
-                "sql": f"""
-                    SELECT id, operation_type, material, geometry_type,
-                           context_snapshot, suggestion_payload, user_choice,
-                           feedback_type, feedback_note, confidence_before, created_at
-                    FROM cam_feedback_history
-                    {where_clause}
-                    ORDER BY created_at DESC
-                """,
+                "sql": sql,
                 "bindings": bindings,
                 "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
             }
         }))
+    except Exception:
+        return
+
+    rows_data = None
+    if result and isinstance(result, dict):
+        rows_data = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
+
+    yield from _iter_export_rows(format, rows_data)
+
+
+def _iter_export_rows(format: str, rows_data: Optional[List[Any]]) -> Iterator[str]:
+    """Format fetched export rows (dict or list format) as CSV/JSON text chunks."""
+    if format == 'csv':
+        if not rows_data:
+            return
 
-        rows = []
+        # Rows go to csv.writer as tuples in _EXPORT_FIELDNAMES order:
+        # list rows already are, dict rows are picked with one itemgetter.
+        # One buffer is reused per line (written, read back, emptied).
+        output = StringIO()
+        writer = csv.writer(output)
+        if isinstance(rows_data[0], dict):
+            lines = map(itemgetter(*_EXPORT_FIELDNAMES), rows_data)
+        else:
+            field_count = len(_EXPORT_FIELDNAMES)
+            lines = (row[:field_count] for row in rows_data if len(row) >= field_count)
+
+        writer.writerow(_EXPORT_FIELDNAMES)
+        for line in lines:
+            writer.writerow(line)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+        # Header is flushed with the first row; emit it alone if none followed
+        if output.tell():
+            yield output.getvalue()
+
+    else:
+        # Same text as json.dumps(rows, indent=2), one element at a time.
+        # Encoded JSON strings never contain raw newlines, so re-indenting
+        # an element is a plain replace.
+        separator = "[\n  "
+        for row in rows_data or ():
+            if isinstance(row, dict):
+                element = row
+            elif isinstance(row, (list, tuple)) and len(row) >= 11:
+                element = dict(zip(_EXPORT_FIELDNAMES, row))
+            else:
+                continue
+            yield separator + _dumps_indented(element).replace("\n", "\n  ")
+            separator = ",\n  "
+        yield "[]" if separator == "[\n  " else "\n]"
+
+
+def export_feedback_history_all(
+    format: str,
+    mcp_call_func: Callable = None
+) -> Dict[str, str]:
+    """
+    Export feedback history for every operation type from a single query.
+
+    Equivalent to calling export_feedback_history(format, operation_type)
+    for each operation type in the table, for one MCP round trip.
+
+    Args:
+        format: 'csv' or 'json'
+        mcp_call_func: MCP call function for SQLite operations
+
+    Returns:
+        Dict of operation_type -> formatted string (CSV or JSON). Empty dict
+        on error or for unknown formats.
+
+    Example:
+        >>> for operation_type, csv_data in export_feedback_history_all('csv', mcp_call).items():
+        ...     with open(f'feedback_{operation_type}.csv', 'w') as f:
+        ...         f.write(csv_data)
+    """
+    if format not in ('csv', 'json'):
+        return {}
+
+    try:
+        result = _unwrap_mcp_result(mcp_call_func("sqlite", {
+            "input": {
+                "database": CAM_FEEDBACK_DATABASE,
+                "sql": _EXPORT_SQL_BY_OPERATION,
+                "bindings": {},
+                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
+            }
+        }))
+
+        rows_data = None
         if result and isinstance(result, dict):
             rows_data = result.get("data_rows_from_result_set") or result.get("rows") or result.get("data") or result.get("result")
-            if rows_data:
-                for row in rows_data:
-                    if isinstance(row, dict):
-                        rows.append(row)
-                    elif isinstance(row, (list, tuple)) and len(row) >= 11:
-                        rows.append({
-                            "id": row[0],
-                            "operation_type": row[1],
-                            "material": row[2],
-                            "geometry_type": row[3],
-                            "context_snapshot": row[4],
-                            "suggestion_payload": row[5],
-                            "user_choice": row[6],
-                            "feedback_type": row[7],
-                            "feedback_note": row[8],
-                            "confidence_before": row[9],
-                            "created_at": row[10]
-                        })
-
-        # Format output
-        if format == 'csv':
-            if not rows:
-                return ""
-
-            output = StringIO()
-            fieldnames = [
-                "id", "operation_type", "material", "geometry_type",
-                "context_snapshot", "suggestion_payload", "user_choice",
-                "feedback_type", "feedback_note", "confidence_before", "created_at"
-            ]
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-            return output.getvalue()
-
-        elif format == 'json':
-            return json.dumps(rows, indent=2)
+        if not rows_data:
+            return {}
 
+        # Rows arrive sorted by operation_type; split them into runs
+        if isinstance(rows_data[0], dict):
+            operation_type_of = itemgetter("operation_type")
         else:
-            return ""
+            operation_type_of = itemgetter(1)
+
+        return {
+            operation_type: "".join(_iter_export_rows(format, list(rows)))
+            for operation_type, rows in itertools.groupby(rows_data, key=operation_type_of)
+        }
 
     except Exception:
-        return ""
+        return {}
 
 
 # =============================================================================
 # FEEDBACK CLEANUP
 # =============================================================================
 
+def _result_row_list(result) -> Optional[List[Any]]:
+    """Get the row list of an unwrapped query result, or None if it has none."""
+    if isinstance(result, dict):
+        for key in ("data_rows_from_result_set", "rows", "data", "result"):
+            rows = result.get(key)
+            if isinstance(rows, list):
+                return rows
+    return None
+
+
 def clear_feedback_history(
     operation_type: Optional[str] = None,
     mcp_call_func: Callable = None
@@ -592,6 +1091,14 @@ def clear_feedback_history(
 
     Per-category reset capability enables targeted learning resets.
 
+    Queued (batch=True) events are flushed first; if that fails nothing is
+    deleted, since the requeued events would be written after the clear.
+
+    The deleted count comes from DELETE ... RETURNING once the MCP sqlite
+    tool has returned its rows for a clear. Until then (and for SQLite
+    before 3.35, or a bridge that returns no rows for writes) the matching
+    rows are counted before the DELETE.
+
     Args:
         operation_type: Optional filter - only delete matching operation type
                         If None, deletes all feedback
@@ -599,54 +1106,89 @@ def clear_feedback_history(
 
     Returns:
         Dict with deletion info:
-        - deleted_count: Number of rows deleted
+        - success: False if the delete (or its count) failed
+        - deleted_count: Number of rows deleted (0 on failure)
         - operation_type: Operation type that was cleared, or "all"
+        - error: Failure description (only when success is False)
+
+        Earlier versions always reported deleted_count 0 and had no
+        success/error keys.
 
     Example:
         >>> result = clear_feedback_history("stock_setup", mcp_call)
         >>> print(f"Deleted {result['deleted_count']} stock_setup feedback events")
     """
+    global _delete_returns_rows
+
+    cleared_type = operation_type or "all"
+
+    def failure(error: str) -> Dict[str, Any]:
+        logger.error("Failed to clear feedback history: %s", error)
+        return {
+            "success": False,
+            "deleted_count": 0,
+            "operation_type": cleared_type,
+            "error": error
+        }
+
     try:
+        # Write queued events first so they are cleared too
+        if not flush_feedback(mcp_call_func):
+            return failure("Could not write queued feedback events before clearing")
+
         # Build DELETE query
         if operation_type:
-            sql = "DELETE FROM cam_feedback_history WHERE operation_type = :operation_type"
             bindings = {"operation_type": operation_type}
-            cleared_type = operation_type
+            returning_sql, count_sql, delete_sql = (
+                _DELETE_SQL_FILTERED, _COUNT_SQL_FILTERED, _DELETE_SQL_FILTERED_PLAIN
+            )
         else:
-            sql = "DELETE FROM cam_feedback_history"
             bindings = {}
-            cleared_type = "all"
+            returning_sql, count_sql, delete_sql = (
+                _DELETE_SQL_ALL, _COUNT_SQL_ALL, _DELETE_SQL_ALL_PLAIN
+            )
+
+        if _delete_returns_rows:
+            # RETURNING is known to work: one returned row per deleted event
+            result = _run_schema_sql(mcp_call_func, returning_sql, bindings)
+            error = _sqlite_error(result)
+            if error is not None:
+                return failure(error)
+            deleted_count = len(_result_row_list(result) or [])
+        else:
+            count_result = _run_schema_sql(mcp_call_func, count_sql, bindings)
+            error = _sqlite_error(count_result)
+            if error is not None:
+                return failure(error)
+            deleted_count = _first_count(count_result)
+
+            deleted = False
+            if deleted_count and _delete_returns_rows is None:
+                # Rows to delete and RETURNING untested: a non-empty row
+                # list proves it works; an empty or missing one means the
+                # bridge drops rows for writes, and the count stands
+                result = _run_schema_sql(mcp_call_func, returning_sql, bindings)
+                if _sqlite_error(result) is None:
+                    deleted = True
+                    rows = _result_row_list(result)
+                    _delete_returns_rows = bool(rows)
+                    if rows:
+                        deleted_count = len(rows)
+                else:
+                    _delete_returns_rows = False
 
-        # Execute delete
-        result = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": sql,
-                "bindings": bindings,
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
+            if not deleted:
+                error = _sqlite_error(_run_schema_sql(mcp_call_func, delete_sql, bindings))
+                if error is not None:
+                    return failure(error)
 
-        # Get row count (SQLite doesn't return affected rows in standard way)
-        # Query to count remaining rows
-        count_result = _unwrap_mcp_result(mcp_call_func("sqlite", {
-            "input": {
-                "database": CAM_FEEDBACK_DATABASE,
-                "sql": "SELECT COUNT(*) FROM cam_feedback_history",
-                "bindings": {},
-                "tool_unlock_token": SQLITE_TOOL_UNLOCK_TOKEN
-            }
-        }))
+        _stats_cache.clear()
 
-        # For simplicity, return success indicator
-        # In production, could query before/after to get exact count
         return {
-            "deleted_count": 0,  # Would need before/after query to compute
+            "success": True,
+            "deleted_count": deleted_count,
             "operation_type": cleared_type
         }
 
-    except Exception:
-        return {
-            "deleted_count": 0,
-            "operation_type": operation_type or "all"
-        }
+    except Exception as e:
+        return failure(str(e))
@@ -15,9 +15,95 @@ Functions:
     get_weighted_acceptance_rate: Calculate weighted acceptance rate from feedback history
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime, timezone
+import calendar
+import functools
 import math
+import time
+
+
+# ln(2), and the decay constant for the default 30-day halflife
+_LN2 = math.log(2)
+_DEFAULT_HALFLIFE_DAYS = 30.0
+_DEFAULT_DECAY_LAMBDA = _LN2 / _DEFAULT_HALFLIFE_DAYS
+
+# feedback_type -> (weight multiplier, counts as accept). Explicit feedback
+# counts 2x (per CONTEXT.md); unknown types are derived from their prefix.
+_FEEDBACK_TYPE_WEIGHTS = {
+    "implicit_accept": (1.0, True),
+    "implicit_reject": (1.0, False),
+    "explicit_good": (2.0, True),
+    "explicit_bad": (2.0, False),
+}
+
+
+def _decay_lambda(halflife_days: float) -> Optional[float]:
+    """
+    Decay constant lambda = ln(2) / halflife_days (precomputed for the default).
+
+    Returns None if halflife_days isn't a non-zero number.
+    """
+    if halflife_days == _DEFAULT_HALFLIFE_DAYS:
+        return _DEFAULT_DECAY_LAMBDA
+    if not isinstance(halflife_days, (int, float)) or not halflife_days:
+        return None
+    return _LN2 / halflife_days
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(feedback_timestamp: str) -> Optional[float]:
+    """
+    Parse a feedback timestamp into POSIX epoch seconds.
+
+    SQLite's datetime('now') format ("YYYY-MM-DD HH:MM:SS", UTC) is sliced
+    directly; anything else goes through fromisoformat(). Memoized: the same
+    history rows are re-read for every suggestion in a context, so each
+    created_at string only needs parsing once per session (malformed ones
+    included, which come back as None).
+    """
+    if not isinstance(feedback_timestamp, str) or len(feedback_timestamp) < 10:
+        return None
+
+    try:
+        if (len(feedback_timestamp) == 19 and feedback_timestamp[10] == ' '
+                and feedback_timestamp[4] == '-' and feedback_timestamp[7] == '-'
+                and feedback_timestamp[13] == ':' and feedback_timestamp[16] == ':'):
+            return float(calendar.timegm((
+                int(feedback_timestamp[0:4]), int(feedback_timestamp[5:7]),
+                int(feedback_timestamp[8:10]), int(feedback_timestamp[11:13]),
+                int(feedback_timestamp[14:16]), int(feedback_timestamp[17:19]),
+                0, 0, 0
+            )))
+
+        # Parse timestamp - handle both with and without 'Z' suffix
+        feedback_dt = datetime.fromisoformat(feedback_timestamp.replace('Z', '+00:00'))
+        if feedback_dt.tzinfo is None:
+            # No timezone info, assume UTC
+            feedback_dt = feedback_dt.replace(tzinfo=timezone.utc)
+        return feedback_dt.timestamp()
+
+    except (ValueError, OverflowError):
+        return None
+
+
+def _recency_weight(feedback_epoch: float, now: float, decay_lambda: float) -> float:
+    """
+    Exponential decay weight for a parsed (epoch seconds) timestamp.
+
+    Takes the clock reading and decay constant precomputed, so a loop over
+    a history pays for them once.
+    """
+    # Calculate age in days
+    age_days = (now - feedback_epoch) / 86400.0  # 86400 seconds per day
+
+    # Calculate exponential decay weight. exp() is always positive; only
+    # future-dated events (clock skew) exceed 1.0 and are capped there,
+    # before exp() could overflow
+    exponent = -decay_lambda * age_days
+    if exponent >= 0.0:
+        return 1.0
+    return math.exp(exponent)
 
 
 def calculate_recency_weight(
@@ -41,36 +127,16 @@ def calculate_recency_weight(
         >>> weight = calculate_recency_weight("2026-01-01 12:00:00", halflife_days=30.0)
         >>> # Recent events have weight near 1.0, old events near 0.0
     """
-    try:
-        # Parse timestamp - handle both with and without 'Z' suffix
-        timestamp_str = feedback_timestamp.replace('Z', '+00:00')
-        if '+' not in timestamp_str and '-' not in timestamp_str[-6:]:
-            # No timezone info, assume UTC
-            feedback_dt = datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
-        else:
-            feedback_dt = datetime.fromisoformat(timestamp_str)
-
-        # Get current time (UTC-aware)
-        now = datetime.now(timezone.utc)
-
-        # Calculate age in days
-        age_seconds = (now - feedback_dt).total_seconds()
-        age_days = age_seconds / 86400.0  # 86400 seconds per day
-
-        # Calculate exponential decay weight
-        # lambda = ln(2) / halflife
-        decay_lambda = math.log(2) / halflife_days
-        weight = math.exp(-decay_lambda * age_days)
-
-        # Clamp to [0.0, 1.0]
-        weight = max(0.0, min(1.0, weight))
+    # lambda = ln(2) / halflife
+    decay_lambda = _decay_lambda(halflife_days)
+    feedback_epoch = _parse_timestamp(feedback_timestamp) if isinstance(feedback_timestamp, str) else None
 
-        return weight
-
-    except Exception:
-        # On error, return neutral weight
+    # Invalid timestamp or halflife: neutral weight
+    if feedback_epoch is None or decay_lambda is None:
         return 0.5
 
+    return _recency_weight(feedback_epoch, time.time(), decay_lambda)
+
 
 def get_weighted_acceptance_rate(
     feedback_history: List[Dict[str, Any]],
@@ -107,6 +173,12 @@ def get_weighted_acceptance_rate(
     weighted_accepts = 0.0
     sample_count = len(feedback_history)
 
+    # Loop invariants: one clock reading and decay constant for the batch
+    now = time.time()
+    decay_lambda = _decay_lambda(halflife_days)  # None: every weight is neutral
+    parse_timestamp = _parse_timestamp
+    type_weights = _FEEDBACK_TYPE_WEIGHTS
+
     for event in feedback_history:
         created_at = event.get("created_at")
         feedback_type = event.get("feedback_type", "")
@@ -114,18 +186,25 @@ def get_weighted_acceptance_rate(
         if not created_at:
             continue
 
-        # Calculate recency weight
-        recency_weight = calculate_recency_weight(created_at, halflife_days)
+        # Calculate recency weight (neutral 0.5 if it can't be computed)
+        feedback_epoch = parse_timestamp(created_at) if isinstance(created_at, str) else None
+        if feedback_epoch is None or decay_lambda is None:
+            recency_weight = 0.5
+        else:
+            recency_weight = _recency_weight(feedback_epoch, now, decay_lambda)
 
-        # Apply 2x multiplier for explicit feedback (per CONTEXT.md)
-        if feedback_type.startswith("explicit_"):
-            recency_weight *= 2.0
+        # One lookup gives the explicit 2x multiplier and accept/reject
+        type_weight = type_weights.get(feedback_type)
+        if type_weight is None:
+            type_weight = (2.0 if feedback_type.startswith("explicit_") else 1.0, False)
+        multiplier, is_accept = type_weight
+        recency_weight *= multiplier
 
         # Add to weighted total
         weighted_total += recency_weight
 
         # If accepted/good, add to weighted accepts
-        if feedback_type in ("implicit_accept", "explicit_good"):
+        if is_accept:
             weighted_accepts += recency_weight
 
     # Calculate acceptance rate
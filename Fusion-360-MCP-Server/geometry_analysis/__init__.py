@@ -17,6 +17,7 @@ Modules:
 from .feature_detector import FeatureDetector, DEFAULT_CONFIG
 from .confidence_scorer import (
     calculate_confidence,
+    calculate_confidence_batch,
     needs_review,
     get_ambiguity_flags,
     CONFIDENCE_THRESHOLDS
@@ -28,6 +29,7 @@ __all__ = [
     'FeatureDetector',
     'DEFAULT_CONFIG',
     'calculate_confidence',
+    'calculate_confidence_batch',
     'needs_review',
     'get_ambiguity_flags',
     'CONFIDENCE_THRESHOLDS',
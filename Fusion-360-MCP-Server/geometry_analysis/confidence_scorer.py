@@ -8,11 +8,14 @@ text explaining the classification.
 Exports:
     CONFIDENCE_THRESHOLDS: Threshold values for confidence levels
     calculate_confidence: Calculate confidence score from detection source
+    calculate_confidence_batch: Scores (no reasoning) for many features at once
     needs_review: Check if confidence requires human review
     get_ambiguity_flags: Identify ambiguous conditions in features
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable
+import functools
+import math
 
 
 # =============================================================================
@@ -33,6 +36,20 @@ BASE_CONFIDENCE = {
     "heuristic": 0.60        # Aspect ratio, depth/diameter rules
 }
 
+# Reasoning-text name for each detection source
+SOURCE_NAMES = {
+    "fusion_api": "Fusion API",
+    "brep_analysis": "BRep analysis",
+    "heuristic": "Heuristic classification"
+}
+
+# Reasoning-text description indexed by clamped complexity (0-10)
+COMPLEXITY_DESC = (
+    ("simple geometry",) * 3
+    + ("moderate complexity",) * 3
+    + ("complex geometry",) * 5
+)
+
 
 # =============================================================================
 # CONFIDENCE FUNCTIONS
@@ -61,42 +78,43 @@ def calculate_confidence(
         (0.95, "Fusion API detection (simple geometry)")
         (0.75, "Heuristic classification: aspect ratio 3.2:1 suggests slot; ambiguous range (2.5-3.5)")
     """
-    # Get base confidence from detection source
-    base = BASE_CONFIDENCE.get(detection_source, 0.60)
+    return _calculate_confidence_cached(
+        detection_source, geometry_complexity, tuple(ambiguity_flags)
+    )
 
-    # Calculate complexity penalty: max 0.15 reduction
+
+@functools.lru_cache(maxsize=256)
+def _calculate_confidence_cached(
+    detection_source: str,
+    geometry_complexity: int,
+    ambiguity_flags: Tuple[str, ...]
+) -> Tuple[float, str]:
+    """
+    Memoized body of calculate_confidence (flags as a hashable tuple).
+
+    Features of one part mostly repeat the same source/complexity/flags, so
+    most calls are a cache hit.
+    """
     complexity = max(0, min(10, geometry_complexity))  # Clamp to 0-10
-    complexity_penalty = min(complexity / 100, 0.15)
+    confidence, complexity_penalty, ambiguity_penalty = _confidence_score(
+        detection_source, complexity, len(ambiguity_flags)
+    )
 
-    # Calculate ambiguity penalty: 0.05 per flag, max 0.25 reduction
-    ambiguity_penalty = min(len(ambiguity_flags) * 0.05, 0.25)
+    # Start with source description (ceil keeps fractional complexity in
+    # the same band as the <=2 / <=5 thresholds)
+    source_name = SOURCE_NAMES.get(detection_source, detection_source)
+    complexity_desc = COMPLEXITY_DESC[math.ceil(complexity)]
+    reasoning = f"{source_name} detection ({complexity_desc})"
 
-    # Calculate final confidence with floor at 0.30
-    confidence = max(0.30, base - complexity_penalty - ambiguity_penalty)
-    confidence = round(confidence, 2)
-
-    # Build reasoning text
-    source_names = {
-        "fusion_api": "Fusion API",
-        "brep_analysis": "BRep analysis",
-        "heuristic": "Heuristic classification"
-    }
-    source_name = source_names.get(detection_source, detection_source)
-
-    # Start with source description
-    if complexity <= 2:
-        complexity_desc = "simple geometry"
-    elif complexity <= 5:
-        complexity_desc = "moderate complexity"
-    else:
-        complexity_desc = "complex geometry"
-
-    reasoning_parts = [f"{source_name} detection ({complexity_desc})"]
+    # Common case: no flags and a small complexity penalty add no notes
+    if not ambiguity_flags and complexity_penalty <= 0.05:
+        return (confidence, reasoning)
+
+    reasoning_parts = [reasoning]
 
     # Add ambiguity notes
     if ambiguity_flags:
-        ambiguity_desc = "; ".join(ambiguity_flags)
-        reasoning_parts.append(f"Ambiguous: {ambiguity_desc}")
+        reasoning_parts.append(f"Ambiguous: {'; '.join(ambiguity_flags)}")
 
     # Add penalty notes if significant
     if complexity_penalty > 0.05:
@@ -104,9 +122,60 @@ def calculate_confidence(
     if ambiguity_penalty > 0:
         reasoning_parts.append(f"ambiguity penalty: -{ambiguity_penalty:.2f}")
 
-    reasoning = "; ".join(reasoning_parts)
+    return (confidence, "; ".join(reasoning_parts))
 
-    return (confidence, reasoning)
+
+def _confidence_score(
+    detection_source: str,
+    complexity: int,
+    flag_count: int
+) -> Tuple[float, float, float]:
+    """
+    Score a feature from its source, clamped complexity and flag count.
+
+    Returns:
+        Tuple of (confidence, complexity_penalty, ambiguity_penalty)
+    """
+    # Get base confidence from detection source
+    base = BASE_CONFIDENCE.get(detection_source, 0.60)
+
+    # Calculate complexity penalty: max 0.15 reduction
+    complexity_penalty = min(complexity / 100, 0.15)
+
+    # Calculate ambiguity penalty: 0.05 per flag, max 0.25 reduction
+    ambiguity_penalty = min(flag_count * 0.05, 0.25)
+
+    # Calculate final confidence with floor at 0.30
+    confidence = max(0.30, base - complexity_penalty - ambiguity_penalty)
+    return (round(confidence, 2), complexity_penalty, ambiguity_penalty)
+
+
+def calculate_confidence_batch(
+    detection_sources: Iterable[str],
+    geometry_complexities: Iterable[int],
+    ambiguity_flags_list: Iterable[List[str]]
+) -> List[float]:
+    """
+    Calculate confidence scores for many features in one pass.
+
+    Scores match calculate_confidence() element for element; no reasoning
+    text is built. Call calculate_confidence() for the features whose
+    reasoning is shown (e.g. those that need_review()).
+
+    Args:
+        detection_sources: Detection source per feature
+        geometry_complexities: Complexity (0-10) per feature
+        ambiguity_flags_list: Ambiguity flag list per feature
+
+    Returns:
+        List of confidence scores (0.30-1.0), in input order
+    """
+    score = _confidence_score
+    return [
+        score(source, max(0, min(10, complexity)), len(flags))[0]
+        for source, complexity, flags
+        in zip(detection_sources, geometry_complexities, ambiguity_flags_list)
+    ]
 
 
 def needs_review(confidence: float) -> bool:
@@ -145,25 +214,41 @@ def get_ambiguity_flags(feature_type: str, metrics: Dict[str, Any]) -> List[str]
     """
     flags = []
 
-    # For pockets/slots: Check aspect_ratio in ambiguous range (2.5-3.5)
-    if feature_type in ["pocket", "slot"]:
-        aspect_ratio = metrics.get("aspect_ratio")
-        if aspect_ratio is not None:
-            if 2.5 <= aspect_ratio <= 3.5:
-                flags.append(f"aspect_ratio in ambiguous range (2.5-3.5): {aspect_ratio:.2f}")
-
-    # For holes: Check segment_count > 3
-    if feature_type == "hole":
-        segment_count = metrics.get("segment_count", 0)
-        if segment_count > 3:
-            flags.append(f"complex hole ({segment_count} segments, >3)")
+    # Type-specific checks (pockets/slots: aspect ratio, holes: segments)
+    check = _AMBIGUITY_HANDLERS.get(feature_type)
+    if check is not None:
+        check(metrics, flags)
 
     # For blind features: Check depth/diameter ratio in 3-4:1 range
-    depth = metrics.get("depth")
-    diameter = metrics.get("diameter")
-    if depth is not None and diameter is not None and diameter > 0:
-        depth_diameter_ratio = depth / diameter
-        if 3.0 <= depth_diameter_ratio <= 4.0:
-            flags.append(f"depth/diameter ratio in ambiguous range (3-4:1): {depth_diameter_ratio:.2f}")
+    if "depth" in metrics and "diameter" in metrics:
+        depth = metrics["depth"]
+        diameter = metrics["diameter"]
+        if depth is not None and diameter is not None and diameter > 0:
+            depth_diameter_ratio = depth / diameter
+            if 3.0 <= depth_diameter_ratio <= 4.0:
+                flags.append(f"depth/diameter ratio in ambiguous range (3-4:1): {depth_diameter_ratio:.2f}")
 
     return flags
+
+
+def _check_aspect(metrics: Dict[str, Any], flags: List[str]) -> None:
+    """Pockets/slots: flag aspect_ratio in the ambiguous range (2.5-3.5)."""
+    aspect_ratio = metrics.get("aspect_ratio")
+    if aspect_ratio is not None:
+        if 2.5 <= aspect_ratio <= 3.5:
+            flags.append(f"aspect_ratio in ambiguous range (2.5-3.5): {aspect_ratio:.2f}")
+
+
+def _check_hole_segments(metrics: Dict[str, Any], flags: List[str]) -> None:
+    """Holes: flag segment_count > 3."""
+    segment_count = metrics.get("segment_count", 0)
+    if segment_count > 3:
+        flags.append(f"complex hole ({segment_count} segments, >3)")
+
+
+# Feature type -> type-specific ambiguity check
+_AMBIGUITY_HANDLERS = {
+    "pocket": _check_aspect,
+    "slot": _check_aspect,
+    "hole": _check_hole_segments,
+}
@@ -12,6 +12,8 @@ Each detected feature includes:
 - Slot classification via aspect ratio heuristic (>3.0)
 """
 
+import math
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 
 # Fusion 360 imports - available when running inside Fusion
@@ -36,6 +38,22 @@ DEFAULT_CONFIG = {
     "min_feature_size_mm": 0.5               # Minimum feature size to detect
 }
 
+# Radians to degrees for segment angles
+_RAD_TO_DEG = 180.0 / math.pi
+
+# Unit label shared by every converted value
+_UNIT_MM = "mm"
+
+# RecognizedHoleSegmentType enum values, indexed by value
+_SEG_TYPE_NAMES = ("Cylinder", "Cone", "Flat", "Torus")
+
+# Sentinel for segment attributes the API object does not expose
+_MISSING = object()
+
+# Bodies whose recognized features are kept per detector (LRU). Entries are
+# keyed by entityToken and revisionId, so any edit to the body produces a new key.
+_RECOGNITION_CACHE_SIZE = 32
+
 
 def _to_mm_unit(cm_value: float) -> Dict[str, Any]:
     """
@@ -52,10 +70,71 @@ def _to_mm_unit(cm_value: float) -> Dict[str, Any]:
     """
     return {
         "value": round(cm_value * 10, 3),
-        "unit": "mm"
+        "unit": _UNIT_MM
     }
 
 
+def _to_mm_point(x_cm: float, y_cm: float, z_cm: float) -> Dict[str, Any]:
+    """
+    Convert a cm point to a dict of mm unit values.
+
+    Returns:
+        Dict with {"x": ..., "y": ..., "z": ...}, each as _to_mm_unit
+    """
+    return {
+        "x": _to_mm_unit(x_cm),
+        "y": _to_mm_unit(y_cm),
+        "z": _to_mm_unit(z_cm)
+    }
+
+
+def _feature_error(feature_type: str, message: str, error: Exception) -> Dict[str, Any]:
+    """
+    Build the record returned for a feature that could not be processed.
+
+    Returns:
+        Dict with the error text, no faces, zero confidence and needs_review set
+    """
+    return {
+        "type": feature_type,
+        "error": str(error),
+        "fusion_faces": [],
+        "confidence": 0.0,
+        "reasoning": f"{message}: {str(error)}",
+        "needs_review": True
+    }
+
+
+def _body_cache_key(body) -> Optional[tuple]:
+    """
+    Build the recognition cache key for a body.
+
+    Returns:
+        (entityToken, revisionId), or None when the body cannot be cached
+        (transient bodies without a token, or no revisionId to detect edits)
+    """
+    try:
+        revision_id = body.revisionId
+        return (body.entityToken, revision_id)
+    except:
+        return None
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> Optional[list]:
+    """Get cached features and mark the entry as most recently used."""
+    features = cache.get(key)
+    if features is not None:
+        cache.move_to_end(key)
+    return features
+
+
+def _cache_put(cache: OrderedDict, key: tuple, features: list, max_entries: int) -> None:
+    """Store features in a recognition cache, evicting the least recently used entry."""
+    cache[key] = features
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
 class FeatureDetector:
     """
     Detects CAM-relevant features using Fusion 360's native APIs.
@@ -66,17 +145,34 @@ class FeatureDetector:
 
     Each feature includes fusion_faces with entityTokens for programmatic
     selection in CAM operations.
+
+    Recognition results are cached per body revision, so re-analyzing an
+    unchanged body skips the RecognizedHole/RecognizedPocket calls. Cached
+    feature dicts are shared between calls and should be treated as read-only.
     """
 
-    def __init__(self):
-        """Initialize the feature detector."""
+    def __init__(self, max_entries: int = _RECOGNITION_CACHE_SIZE):
+        """
+        Initialize the feature detector.
+
+        Args:
+            max_entries: Bodies kept in each recognition cache (LRU)
+        """
         self._api_available = FUSION_CAM_AVAILABLE
+        self._max_entries = max_entries
+        self._hole_cache: OrderedDict = OrderedDict()
+        self._pocket_cache: OrderedDict = OrderedDict()
 
     @property
     def is_available(self) -> bool:
         """Check if Fusion CAM API is available."""
         return self._api_available
 
+    def clear_cache(self) -> None:
+        """Drop all cached hole and pocket recognition results."""
+        self._hole_cache.clear()
+        self._pocket_cache.clear()
+
     def detect_holes(self, body) -> List[Dict[str, Any]]:
         """
         Detect all holes in a body using Fusion's RecognizedHole API.
@@ -101,7 +197,12 @@ class FeatureDetector:
         if not self._api_available:
             return []
 
-        features = []
+        # Reuse features recognized for this body revision
+        cache_key = _body_cache_key(body)
+        if cache_key is not None:
+            cached = _cache_get(self._hole_cache, cache_key)
+            if cached is not None:
+                return list(cached)
 
         try:
             # Use Fusion's RecognizedHole API
@@ -111,116 +212,16 @@ class FeatureDetector:
             if holes is None:
                 return []
 
-            for hole in holes:
-                try:
-                    # Extract segment information
-                    segments = []
-                    total_depth_cm = 0.0
-                    diameter_cm = None
-
-                    # Get segment count
-                    segment_count = hole.segmentCount if hasattr(hole, 'segmentCount') else 0
-
-                    # Iterate through segments to get geometry data
-                    if hasattr(hole, 'segments'):
-                        for segment in hole.segments:
-                            seg_info = {
-                                "type": self._get_segment_type_name(segment)
-                            }
-
-                            # Extract segment length for depth calculation
-                            if hasattr(segment, 'length'):
-                                seg_length_cm = segment.length
-                                total_depth_cm += seg_length_cm
-                                seg_info["length"] = _to_mm_unit(seg_length_cm)
-
-                            # Get diameter from cylindrical segments
-                            if hasattr(segment, 'diameter') and diameter_cm is None:
-                                diameter_cm = segment.diameter
-                                seg_info["diameter"] = _to_mm_unit(segment.diameter)
-
-                            # Get taper angle for conical segments
-                            if hasattr(segment, 'angle'):
-                                seg_info["angle_deg"] = round(segment.angle * 180 / 3.14159, 2)
-
-                            segments.append(seg_info)
-
-                    # Extract entityTokens from hole faces for programmatic selection
-                    face_tokens = []
-                    if hasattr(hole, 'faces'):
-                        for face in hole.faces:
-                            if hasattr(face, 'entityToken'):
-                                face_tokens.append(face.entityToken)
-
-                    # Calculate confidence using confidence_scorer module
-                    # Complexity based on segment count (each segment adds 2 complexity)
-                    complexity = min(segment_count * 2, 10)
-
-                    # Get ambiguity flags for holes
-                    depth_mm = total_depth_cm * 10 if total_depth_cm > 0 else None
-                    diameter_mm = diameter_cm * 10 if diameter_cm else None
-                    ambiguity_metrics = {
-                        "segment_count": segment_count,
-                    }
-                    if depth_mm and diameter_mm:
-                        ambiguity_metrics["depth"] = depth_mm
-                        ambiguity_metrics["diameter"] = diameter_mm
-
-                    ambiguity_flags = get_ambiguity_flags("hole", ambiguity_metrics)
-                    confidence_score, reasoning_text = calculate_confidence(
-                        "fusion_api",
-                        complexity,
-                        ambiguity_flags
-                    )
-
-                    # Enhance reasoning with specific hole info
-                    if segment_count <= 1:
-                        reasoning_text = f"Simple cylindrical hole; {reasoning_text}"
-                    elif segment_count <= 3:
-                        reasoning_text = f"Multi-segment hole ({segment_count} segments); {reasoning_text}"
-                    else:
-                        reasoning_text = f"Complex hole ({segment_count} segments, may be counterbore/countersink); {reasoning_text}"
-
-                    review_needed = needs_review(confidence_score)
-
-                    feature = {
-                        "type": "hole",
-                        "diameter": _to_mm_unit(diameter_cm) if diameter_cm else None,
-                        "depth": _to_mm_unit(total_depth_cm) if total_depth_cm > 0 else None,
-                        "segment_count": segment_count,
-                        "segments": segments if segments else None,
-                        "fusion_faces": face_tokens,
-                        "confidence": confidence_score,
-                        "reasoning": reasoning_text,
-                        "needs_review": review_needed
-                    }
-
-                    features.append(feature)
-
-                except Exception as hole_error:
-                    # Log individual hole processing errors but continue
-                    features.append({
-                        "type": "hole",
-                        "error": str(hole_error),
-                        "fusion_faces": [],
-                        "confidence": 0.0,
-                        "reasoning": f"Error processing hole: {str(hole_error)}",
-                        "needs_review": True
-                    })
+            features = [self._safe_process_hole(hole) for hole in holes]
 
         except Exception as e:
             # API call failed - return empty list with error flag
             # This can happen if RecognizedHole is not available in this Fusion version
-            return [{
-                "type": "hole_detection_error",
-                "error": str(e),
-                "fusion_faces": [],
-                "confidence": 0.0,
-                "reasoning": f"RecognizedHole API failed: {str(e)}",
-                "needs_review": True
-            }]
+            return [_feature_error("hole_detection_error", "RecognizedHole API failed", e)]
 
-        return features
+        if cache_key is not None:
+            _cache_put(self._hole_cache, cache_key, features, self._max_entries)
+        return list(features)
 
     def detect_pockets(
         self,
@@ -265,7 +266,22 @@ class FeatureDetector:
         slot_threshold = cfg.get("slot_aspect_ratio_threshold", 3.0)
         slot_ambiguous_range = cfg.get("slot_ambiguous_range", (2.5, 3.5))
 
-        features = []
+        # Reuse features recognized for this body revision, tool direction
+        # and slot threshold
+        cache_key = _body_cache_key(body)
+        if cache_key is not None:
+            try:
+                if tool_direction is None:
+                    direction_key = (0, 0, -1)
+                else:
+                    direction_key = (tool_direction.x, tool_direction.y, tool_direction.z)
+                cache_key = cache_key + (direction_key, slot_threshold)
+            except:
+                cache_key = None
+        if cache_key is not None:
+            cached = _cache_get(self._pocket_cache, cache_key)
+            if cached is not None:
+                return list(cached)
 
         try:
             # Default tool direction: Z-down (standard 3-axis vertical machining)
@@ -279,157 +295,250 @@ class FeatureDetector:
             if pockets is None:
                 return []
 
-            for pocket in pockets:
-                try:
-                    # Extract pocket depth
-                    depth_cm = None
-                    if hasattr(pocket, 'depth'):
-                        depth_cm = pocket.depth
-
-                    # Check if pocket goes through the part
-                    is_through = False
-                    if hasattr(pocket, 'isThrough'):
-                        is_through = pocket.isThrough
-
-                    # Extract entityTokens from pocket faces for programmatic selection
-                    face_tokens = []
-                    min_x = min_y = min_z = float('inf')
-                    max_x = max_y = max_z = float('-inf')
-
-                    if hasattr(pocket, 'faces'):
-                        for face in pocket.faces:
-                            if hasattr(face, 'entityToken'):
-                                face_tokens.append(face.entityToken)
-
-                            # Calculate bounding box from face positions
-                            try:
-                                bbox = face.boundingBox
-                                if bbox:
-                                    min_x = min(min_x, bbox.minPoint.x)
-                                    min_y = min(min_y, bbox.minPoint.y)
-                                    min_z = min(min_z, bbox.minPoint.z)
-                                    max_x = max(max_x, bbox.maxPoint.x)
-                                    max_y = max(max_y, bbox.maxPoint.y)
-                                    max_z = max(max_z, bbox.maxPoint.z)
-                            except:
-                                pass
-
-                    # Build dimensions dict from bounding box
-                    dimensions = None
-                    aspect_ratio = 1.0
-                    width_mm = 0.0
-                    length_mm = 0.0
-                    depth_mm = depth_cm * 10 if depth_cm else 0.0
-
-                    if min_x != float('inf'):
-                        width_cm = max_x - min_x
-                        length_cm = max_y - min_y
-                        height_cm = max_z - min_z
-
-                        width_mm = width_cm * 10
-                        length_mm = length_cm * 10
-
-                        # Calculate aspect ratio for slot classification
-                        # aspect_ratio = max(length, width) / min(length, width)
-                        if width_mm > 0 and length_mm > 0:
-                            max_dim = max(length_mm, width_mm)
-                            min_dim = min(length_mm, width_mm)
-                            aspect_ratio = round(max_dim / min_dim, 2) if min_dim > 0 else 1.0
-
-                        dimensions = {
-                            "width": _to_mm_unit(width_cm),
-                            "length": _to_mm_unit(length_cm),
-                            "height": _to_mm_unit(height_cm),
-                            "bounding_box": {
-                                "min_point": {
-                                    "x": _to_mm_unit(min_x),
-                                    "y": _to_mm_unit(min_y),
-                                    "z": _to_mm_unit(min_z)
-                                },
-                                "max_point": {
-                                    "x": _to_mm_unit(max_x),
-                                    "y": _to_mm_unit(max_y),
-                                    "z": _to_mm_unit(max_z)
-                                }
-                            }
-                        }
-
-                    # Classify as slot or pocket based on aspect ratio
-                    # Per CONTEXT.md: slot if aspect_ratio > 3.0
-                    if aspect_ratio > slot_threshold:
-                        feature_type = "slot"
-                    else:
-                        feature_type = "pocket"
-
-                    # Get ambiguity flags for slot/pocket classification
-                    ambiguity_metrics = {"aspect_ratio": aspect_ratio}
-                    if depth_mm > 0 and min(width_mm, length_mm) > 0:
-                        # Use the smaller dimension as the "diameter" equivalent
-                        ambiguity_metrics["depth"] = depth_mm
-                        ambiguity_metrics["diameter"] = min(width_mm, length_mm)
-
-                    ambiguity_flags = get_ambiguity_flags(feature_type, ambiguity_metrics)
-
-                    # Calculate geometry complexity (0 for simple, higher for complex)
-                    # Through pockets are slightly more complex
-                    complexity = 2 if is_through else 0
-
-                    # Calculate confidence using confidence_scorer
-                    confidence_score, reasoning_text = calculate_confidence(
-                        "fusion_api",
-                        complexity,
-                        ambiguity_flags
-                    )
-
-                    # Enhance reasoning with feature-specific info
-                    if feature_type == "slot":
-                        reasoning_text = f"Slot classified (aspect ratio {aspect_ratio}:1 > {slot_threshold}); {reasoning_text}"
-                    else:
-                        reasoning_text = f"Pocket classified (aspect ratio {aspect_ratio}:1); {reasoning_text}"
-
-                    if is_through:
-                        reasoning_text = f"Through feature; {reasoning_text}"
-
-                    review_needed = needs_review(confidence_score)
-
-                    feature = {
-                        "type": feature_type,
-                        "aspect_ratio": aspect_ratio,
-                        "depth": _to_mm_unit(depth_cm) if depth_cm else None,
-                        "is_through": is_through,
-                        "dimensions": dimensions,
-                        "fusion_faces": face_tokens,
-                        "confidence": confidence_score,
-                        "reasoning": reasoning_text,
-                        "needs_review": review_needed
-                    }
-
-                    features.append(feature)
-
-                except Exception as pocket_error:
-                    # Log individual pocket processing errors but continue
-                    features.append({
-                        "type": "pocket",
-                        "error": str(pocket_error),
-                        "fusion_faces": [],
-                        "confidence": 0.0,
-                        "reasoning": f"Error processing pocket: {str(pocket_error)}",
-                        "needs_review": True
-                    })
+            features = [self._safe_process_pocket(pocket, slot_threshold) for pocket in pockets]
 
         except Exception as e:
             # API call failed - return empty list with error flag
             # This can happen if RecognizedPocket is not available in this Fusion version
-            return [{
-                "type": "pocket_detection_error",
-                "error": str(e),
-                "fusion_faces": [],
-                "confidence": 0.0,
-                "reasoning": f"RecognizedPocket API failed: {str(e)}",
-                "needs_review": True
-            }]
+            return [_feature_error("pocket_detection_error", "RecognizedPocket API failed", e)]
 
-        return features
+        if cache_key is not None:
+            _cache_put(self._pocket_cache, cache_key, features, self._max_entries)
+        return list(features)
+
+    def _safe_process_hole(self, hole) -> Dict[str, Any]:
+        """
+        Build the feature dict for one recognized hole.
+
+        A failure is reported on that hole's own record so the remaining
+        holes of the body are still returned.
+        """
+        try:
+            return self._process_hole(hole)
+        except Exception as hole_error:
+            return _feature_error("hole", "Error processing hole", hole_error)
+
+    def _process_hole(self, hole) -> Dict[str, Any]:
+        """Extract segments, face tokens and confidence for one hole."""
+        # Extract segment information
+        segments = []
+        total_depth_cm = 0.0
+        diameter_cm = None
+
+        # Get segment count
+        segment_count = getattr(hole, 'segmentCount', 0)
+
+        # Iterate through segments to get geometry data.
+        # Each attribute is fetched once with a sentinel default rather
+        # than probed with hasattr and then read again.
+        hole_segments = getattr(hole, 'segments', _MISSING)
+        if hole_segments is not _MISSING:
+            for segment in hole_segments:
+                seg_info = {
+                    "type": self._get_segment_type_name(segment)
+                }
+
+                # Extract segment length for depth calculation
+                seg_length_cm = getattr(segment, 'length', _MISSING)
+                if seg_length_cm is not _MISSING:
+                    total_depth_cm += seg_length_cm
+                    seg_info["length"] = _to_mm_unit(seg_length_cm)
+
+                # Get diameter from cylindrical segments
+                if diameter_cm is None:
+                    seg_diameter_cm = getattr(segment, 'diameter', _MISSING)
+                    if seg_diameter_cm is not _MISSING:
+                        diameter_cm = seg_diameter_cm
+                        seg_info["diameter"] = _to_mm_unit(seg_diameter_cm)
+
+                # Get taper angle for conical segments
+                seg_angle = getattr(segment, 'angle', _MISSING)
+                if seg_angle is not _MISSING:
+                    seg_info["angle_deg"] = round(seg_angle * _RAD_TO_DEG, 2)
+
+                segments.append(seg_info)
+
+        # Extract entityTokens from hole faces for programmatic selection
+        faces = getattr(hole, 'faces', ())
+        try:
+            face_tokens = [face.entityToken for face in faces]
+        except AttributeError:
+            face_tokens = [face.entityToken for face in faces if hasattr(face, 'entityToken')]
+
+        # Calculate confidence using confidence_scorer module
+        # Complexity based on segment count (each segment adds 2 complexity)
+        complexity = min(segment_count * 2, 10)
+
+        # Get ambiguity flags for holes
+        depth_mm = total_depth_cm * 10 if total_depth_cm > 0 else None
+        diameter_mm = diameter_cm * 10 if diameter_cm else None
+        ambiguity_metrics = {
+            "segment_count": segment_count,
+        }
+        if depth_mm and diameter_mm:
+            ambiguity_metrics["depth"] = depth_mm
+            ambiguity_metrics["diameter"] = diameter_mm
+
+        ambiguity_flags = get_ambiguity_flags("hole", ambiguity_metrics)
+        confidence_score, reasoning_text = calculate_confidence(
+            "fusion_api",
+            complexity,
+            ambiguity_flags
+        )
+
+        # Enhance reasoning with specific hole info
+        if segment_count <= 1:
+            reasoning_text = f"Simple cylindrical hole; {reasoning_text}"
+        elif segment_count <= 3:
+            reasoning_text = f"Multi-segment hole ({segment_count} segments); {reasoning_text}"
+        else:
+            reasoning_text = f"Complex hole ({segment_count} segments, may be counterbore/countersink); {reasoning_text}"
+
+        review_needed = needs_review(confidence_score)
+
+        return {
+            "type": "hole",
+            "diameter": _to_mm_unit(diameter_cm) if diameter_cm else None,
+            "depth": _to_mm_unit(total_depth_cm) if total_depth_cm > 0 else None,
+            "segment_count": segment_count,
+            "segments": segments if segments else None,
+            "fusion_faces": face_tokens,
+            "confidence": confidence_score,
+            "reasoning": reasoning_text,
+            "needs_review": review_needed
+        }
+
+    def _safe_process_pocket(self, pocket, slot_threshold: float) -> Dict[str, Any]:
+        """
+        Build the feature dict for one recognized pocket or slot.
+
+        A failure is reported on that pocket's own record so the remaining
+        pockets of the body are still returned.
+        """
+        try:
+            return self._process_pocket(pocket, slot_threshold)
+        except Exception as pocket_error:
+            return _feature_error("pocket", "Error processing pocket", pocket_error)
+
+    def _process_pocket(self, pocket, slot_threshold: float) -> Dict[str, Any]:
+        """Extract bounding box, slot classification and confidence for one pocket."""
+        # Extract pocket depth
+        depth_cm = None
+        if hasattr(pocket, 'depth'):
+            depth_cm = pocket.depth
+
+        # Check if pocket goes through the part
+        is_through = False
+        if hasattr(pocket, 'isThrough'):
+            is_through = pocket.isThrough
+
+        # Extract entityTokens from pocket faces for programmatic selection
+        face_tokens = []
+        # Face bounding-box corners, gathered once and reduced per axis below
+        min_corners = []
+        max_corners = []
+
+        if hasattr(pocket, 'faces'):
+            for face in pocket.faces:
+                if hasattr(face, 'entityToken'):
+                    face_tokens.append(face.entityToken)
+
+                # Calculate bounding box from face positions
+                try:
+                    bbox = face.boundingBox
+                    if bbox:
+                        lo = bbox.minPoint
+                        hi = bbox.maxPoint
+                        lo_corner = (lo.x, lo.y, lo.z)
+                        hi_corner = (hi.x, hi.y, hi.z)
+                        min_corners.append(lo_corner)
+                        max_corners.append(hi_corner)
+                except:
+                    pass
+
+        # Build dimensions dict from bounding box
+        dimensions = None
+        aspect_ratio = 1.0
+        width_mm = 0.0
+        length_mm = 0.0
+        depth_mm = depth_cm * 10 if depth_cm else 0.0
+
+        if min_corners:
+            min_x, min_y, min_z = map(min, zip(*min_corners))
+            max_x, max_y, max_z = map(max, zip(*max_corners))
+            width_cm = max_x - min_x
+            length_cm = max_y - min_y
+            height_cm = max_z - min_z
+
+            width_mm = width_cm * 10
+            length_mm = length_cm * 10
+
+            # Calculate aspect ratio for slot classification
+            # aspect_ratio = max(length, width) / min(length, width)
+            if width_mm > 0 and length_mm > 0:
+                max_dim = max(length_mm, width_mm)
+                min_dim = min(length_mm, width_mm)
+                aspect_ratio = round(max_dim / min_dim, 2) if min_dim > 0 else 1.0
+
+            dimensions = {
+                "width": _to_mm_unit(width_cm),
+                "length": _to_mm_unit(length_cm),
+                "height": _to_mm_unit(height_cm),
+                "bounding_box": {
+                    "min_point": _to_mm_point(min_x, min_y, min_z),
+                    "max_point": _to_mm_point(max_x, max_y, max_z)
+                }
+            }
+
+        # Classify as slot or pocket based on aspect ratio
+        # Per CONTEXT.md: slot if aspect_ratio > 3.0
+        if aspect_ratio > slot_threshold:
+            feature_type = "slot"
+        else:
+            feature_type = "pocket"
+
+        # Get ambiguity flags for slot/pocket classification
+        ambiguity_metrics = {"aspect_ratio": aspect_ratio}
+        if depth_mm > 0 and min(width_mm, length_mm) > 0:
+            # Use the smaller dimension as the "diameter" equivalent
+            ambiguity_metrics["depth"] = depth_mm
+            ambiguity_metrics["diameter"] = min(width_mm, length_mm)
+
+        ambiguity_flags = get_ambiguity_flags(feature_type, ambiguity_metrics)
+
+        # Calculate geometry complexity (0 for simple, higher for complex)
+        # Through pockets are slightly more complex
+        complexity = 2 if is_through else 0
+
+        # Calculate confidence using confidence_scorer
+        confidence_score, reasoning_text = calculate_confidence(
+            "fusion_api",
+            complexity,
+            ambiguity_flags
+        )
+
+        # Enhance reasoning with feature-specific info
+        if feature_type == "slot":
+            reasoning_text = f"Slot classified (aspect ratio {aspect_ratio}:1 > {slot_threshold}); {reasoning_text}"
+        else:
+            reasoning_text = f"Pocket classified (aspect ratio {aspect_ratio}:1); {reasoning_text}"
+
+        if is_through:
+            reasoning_text = f"Through feature; {reasoning_text}"
+
+        review_needed = needs_review(confidence_score)
+
+        return {
+            "type": feature_type,
+            "aspect_ratio": aspect_ratio,
+            "depth": _to_mm_unit(depth_cm) if depth_cm else None,
+            "is_through": is_through,
+            "dimensions": dimensions,
+            "fusion_faces": face_tokens,
+            "confidence": confidence_score,
+            "reasoning": reasoning_text,
+            "needs_review": review_needed
+        }
 
     def _get_segment_type_name(self, segment) -> str:
         """
@@ -438,18 +547,16 @@ class FeatureDetector:
         Hole segments can be: Cylinder, Cone, Flat, Torus
         """
         try:
-            if hasattr(segment, 'type'):
-                seg_type = segment.type
-                # RecognizedHoleSegmentType enum values
-                type_names = {
-                    0: "Cylinder",
-                    1: "Cone",
-                    2: "Flat",
-                    3: "Torus"
-                }
-                if hasattr(seg_type, 'value'):
-                    return type_names.get(seg_type.value, f"Unknown({seg_type.value})")
-                return type_names.get(int(seg_type), str(seg_type))
+            seg_type = segment.type
+            if hasattr(seg_type, 'value'):
+                type_value = seg_type.value
+                if 0 <= type_value < len(_SEG_TYPE_NAMES):
+                    return _SEG_TYPE_NAMES[type_value]
+                return f"Unknown({type_value})"
+            type_value = int(seg_type)
+            if 0 <= type_value < len(_SEG_TYPE_NAMES):
+                return _SEG_TYPE_NAMES[type_value]
+            return str(seg_type)
         except:
             pass
         return "Unknown"
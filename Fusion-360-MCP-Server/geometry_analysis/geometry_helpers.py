@@ -66,13 +66,17 @@ def calculate_minimum_tool_radii(body, features: List[Dict[str, Any]]) -> Dict[s
 
     global_min_radius_mm = float('inf')
 
+    # Bind geometry classes once; the loop below runs per face and per edge
+    torus_cls = adsk.core.Torus
+    arc_classes = (adsk.core.Circle, adsk.core.Arc3D)
+
     try:
         # Scan all faces for smallest concave radius
         for face in body.faces:
             geom = face.geometry
 
             # Check toroidal faces (fillets, rounds)
-            if isinstance(geom, adsk.core.Torus):
+            if isinstance(geom, torus_cls):
                 minor_radius_mm = geom.minorRadius * 10  # cm to mm
                 if minor_radius_mm < global_min_radius_mm:
                     global_min_radius_mm = minor_radius_mm
@@ -80,7 +84,7 @@ def calculate_minimum_tool_radii(body, features: List[Dict[str, Any]]) -> Dict[s
             # Check edges for small arcs
             for edge in face.edges:
                 edge_geom = edge.geometry
-                if isinstance(edge_geom, (adsk.core.Circle, adsk.core.Arc3D)):
+                if isinstance(edge_geom, arc_classes):
                     radius_mm = edge_geom.radius * 10  # cm to mm
                     if radius_mm < global_min_radius_mm:
                         global_min_radius_mm = radius_mm
@@ -145,9 +145,10 @@ class OrientationAnalyzer:
             Area in cm^2 (Fusion internal units)
         """
         # Get dimensions in cm
-        x_dim = bbox.maxPoint.x - bbox.minPoint.x
-        y_dim = bbox.maxPoint.y - bbox.minPoint.y
-        z_dim = bbox.maxPoint.z - bbox.minPoint.z
+        min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+        x_dim = max_pt.x - min_pt.x
+        y_dim = max_pt.y - min_pt.y
+        z_dim = max_pt.z - min_pt.z
 
         if axis == "Z_UP":
             # Base is XY plane
@@ -171,9 +172,10 @@ class OrientationAnalyzer:
         Returns:
             Approximate surface area in cm^2
         """
-        x_dim = bbox.maxPoint.x - bbox.minPoint.x
-        y_dim = bbox.maxPoint.y - bbox.minPoint.y
-        z_dim = bbox.maxPoint.z - bbox.minPoint.z
+        min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+        x_dim = max_pt.x - min_pt.x
+        y_dim = max_pt.y - min_pt.y
+        z_dim = max_pt.z - min_pt.z
 
         # Sum of all three face pairs (2 * each face area)
         # For scoring, we use half (one of each face type)
@@ -195,9 +197,10 @@ class OrientationAnalyzer:
             Dict with width, depth, height in mm
         """
         # Get dimensions in mm (convert from cm)
-        x_mm = round((bbox.maxPoint.x - bbox.minPoint.x) * 10, 3)
-        y_mm = round((bbox.maxPoint.y - bbox.minPoint.y) * 10, 3)
-        z_mm = round((bbox.maxPoint.z - bbox.minPoint.z) * 10, 3)
+        min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+        x_mm = round((max_pt.x - min_pt.x) * 10, 3)
+        y_mm = round((max_pt.y - min_pt.y) * 10, 3)
+        z_mm = round((max_pt.z - min_pt.z) * 10, 3)
 
         if axis == "Z_UP":
             return {
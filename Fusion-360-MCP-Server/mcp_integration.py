@@ -324,14 +324,19 @@ Returns: setups, operations, stock configuration, active setup, post-processor.
   "limit": 50
 }
 Returns: tools with diameter, flutes, lengths, vendor info.
+more_available is true when more tools matched the filter than limit.
 
 ### analyze_geometry_for_cam - Analyze Part Geometry
 {
   "operation": "analyze_geometry_for_cam",
   "body_names": ["Part1"],
-  "analysis_type": "full"
+  "analysis_type": "full",
+  "max_features": 20,
+  "max_faces": 5000
 }
 Returns: bounding box, volume, features, min radius, orientation suggestions.
+max_features caps the face features listed per body (counts still cover all scanned faces).
+max_faces caps the faces scanned per body; larger bodies report faces_scanned_truncated.
 
 ### suggest_stock_setup - Get Stock Recommendations
 {
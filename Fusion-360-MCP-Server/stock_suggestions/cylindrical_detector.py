@@ -63,9 +63,10 @@ def _get_bounding_box_dimensions(body) -> Optional[Dict[str, float]]:
             return None
 
         # Get dimensions in mm (API returns cm)
-        x_mm = _to_mm(bbox.maxPoint.x - bbox.minPoint.x)
-        y_mm = _to_mm(bbox.maxPoint.y - bbox.minPoint.y)
-        z_mm = _to_mm(bbox.maxPoint.z - bbox.minPoint.z)
+        min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+        x_mm = _to_mm(max_pt.x - min_pt.x)
+        y_mm = _to_mm(max_pt.y - min_pt.y)
+        z_mm = _to_mm(max_pt.z - min_pt.z)
 
         return {
             "x_mm": round(x_mm, 3),
@@ -94,13 +95,16 @@ def _count_cylindrical_faces(body) -> tuple:
         total_count = faces.count
         cylindrical_count = 0
 
+        # Resolve the class once rather than per face
+        cylinder_cls = getattr(adsk.core, 'Cylinder', None)
+        if cylinder_cls is None:
+            return (0, total_count)
+
         for face in faces:
             try:
-                geometry = face.geometry
-                if geometry is not None:
-                    # Check if face geometry is a Cylinder
-                    if hasattr(adsk.core, 'Cylinder') and isinstance(geometry, adsk.core.Cylinder):
-                        cylindrical_count += 1
+                # Check if face geometry is a Cylinder
+                if isinstance(face.geometry, cylinder_cls):
+                    cylindrical_count += 1
             except Exception:
                 continue
 
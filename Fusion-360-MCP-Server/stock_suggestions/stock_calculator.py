@@ -84,9 +84,10 @@ def calculate_stock_dimensions(
 
     # Extract raw dimensions from bounding box
     # Fusion 360 API uses centimeters, convert to millimeters (* 10)
-    raw_width = (bbox.maxPoint.x - bbox.minPoint.x) * 10  # X dimension in mm
-    raw_depth = (bbox.maxPoint.y - bbox.minPoint.y) * 10  # Y dimension in mm
-    raw_height = (bbox.maxPoint.z - bbox.minPoint.z) * 10  # Z dimension in mm
+    min_pt, max_pt = bbox.minPoint, bbox.maxPoint
+    raw_width = (max_pt.x - min_pt.x) * 10  # X dimension in mm
+    raw_depth = (max_pt.y - min_pt.y) * 10  # Y dimension in mm
+    raw_height = (max_pt.z - min_pt.z) * 10  # Z dimension in mm
 
     # Apply offsets
     # XY: Applied to all 4 sides (2x per axis for width/depth)
@@ -0,0 +1,88 @@
+"""
+Tests for get_tool_library filter handling.
+
+Run outside Fusion 360 with: python -m unittest discover tests
+
+The add-in folder is loaded as a package (cam_operations uses relative
+imports) and the CAM product is replaced by a small document tool library.
+"""
+
+import importlib
+import json
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ADDIN_DIR = Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "fusion_mcp_addin"
+
+
+def _load_cam_operations():
+    """Import cam_operations as a submodule of the add-in folder."""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(ADDIN_DIR)]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(f"{PACKAGE_NAME}.cam_operations")
+
+
+cam_operations = _load_cam_operations()
+
+
+class FakeTool:
+    """Document library tool exposing toJson() like adsk.cam.Tool."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def toJson(self):
+        return json.dumps(self._data)
+
+
+class FakeToolLibrary:
+    """Document tool library exposing count/item() like adsk.cam.DocumentToolLibrary."""
+
+    def __init__(self, tools):
+        self._tools = tools
+
+    @property
+    def count(self):
+        return len(self._tools)
+
+    def item(self, index):
+        return self._tools[index]
+
+
+class GetToolLibraryFilterTest(unittest.TestCase):
+
+    def setUp(self):
+        tools = [
+            FakeTool({"type": "flat end mill", "geometry": {"DC": 6.0}, "description": "6mm flat"}),
+            FakeTool({"type": "drill", "geometry": {"DC": 5.0}, "description": "5mm drill"}),
+        ]
+        self.cam = types.SimpleNamespace(documentToolLibrary=FakeToolLibrary(tools))
+        self.app = types.SimpleNamespace(activeDocument=types.SimpleNamespace(
+            creationId="test-document", name="Test", dataFile=None
+        ))
+        cam_operations._tool_library_cache.clear()
+
+    def _get_tool_library(self, arguments):
+        with mock.patch.object(cam_operations, "_get_cam_product", return_value=self.cam), \
+                mock.patch.object(cam_operations, "_get_app", return_value=self.app):
+            response = cam_operations.handle_get_tool_library(arguments)
+        self.assertFalse(response["isError"])
+        return json.loads(response["content"][0]["text"])
+
+    def test_null_type_filter_returns_all_tools(self):
+        result = self._get_tool_library({"filter": {"type": None}})
+        self.assertEqual(result["returned_count"], 2)
+
+    def test_type_filter_matches_case_insensitively(self):
+        result = self._get_tool_library({"filter": {"type": ["End MILL"]}})
+        self.assertEqual([tool["description"] for tool in result["tools"]], ["6mm flat"])
+
+
+if __name__ == "__main__":
+    unittest.main()